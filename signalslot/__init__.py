@@ -1,6 +1,10 @@
 try:
-    from .signal import Signal
+    from .signal import Signal, disconnect_owner, blocked_signals
+    from .signal import KWARGS, MAPPING, ARGS, BATCH, FREE_THREADED
     from .slot import Slot
+    from .cache import EmitCache
+    from .breaker import CircuitBreaker
+    from .channel import Channel
     from .exceptions import *
 except ImportError:  # pragma: no cover
     # Possible we are running from setup.py, in which case we're after
@@ -0,0 +1,102 @@
+"""
+Multi-core scaling benchmark for signal emits.
+
+:py:func:`run` emits the same thread safe signal from an increasing number
+of threads, each thread doing the same number of emits, and reports the
+emits per second and the speedup over one thread. With the GIL, it stays
+around 1. On free-threaded builds of Python, see
+:py:data:`~signalslot.signal.FREE_THREADED`, it is expected to grow with
+the number of cores. Run it with::
+
+    python -m signalslot.benchmark --emits 100000 --slots 10
+"""
+
+import argparse
+import functools
+import os
+import threading
+import time
+
+from .signal import Signal, FREE_THREADED
+
+
+def _slot(value, **kwargs):
+    # A little work, so that the benchmark is not only call overhead.
+    return None if value * value >= 0 else value
+
+
+def measure(threads, emits, slots):
+    """
+    Return the seconds taken by ``threads`` threads doing ``emits`` emits
+    each on a signal with ``slots`` slots.
+    """
+    signal = Signal(args=['value'], threadsafe=True, stats=True)
+    for i in range(slots):
+        signal.connect(functools.partial(_slot))
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        emit = signal.emit
+        barrier.wait()
+        for i in range(emits):
+            emit(value=i)
+
+    workers = [threading.Thread(target=worker) for n in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    if signal.emit_stats()['emits'] != threads * emits:
+        raise RuntimeError('Lost emits counting %s threads' % threads)
+    return elapsed
+
+
+def run(threads=None, emits=20000, slots=10):
+    """
+    Return a list of dicts with the throughput for each number of
+    ``threads``, powers of two up to the number of CPUs by default.
+    """
+    if threads is None:
+        cpus = os.cpu_count() or 1
+        threads = [1]
+        while threads[-1] * 2 <= cpus:
+            threads.append(threads[-1] * 2)
+
+    report = []
+    for n in threads:
+        elapsed = measure(n, emits, slots)
+        throughput = n * emits / elapsed
+        report.append({
+            'threads': n,
+            'emits': n * emits,
+            'elapsed': elapsed,
+            'emits_per_second': throughput,
+            'speedup': throughput / report[0]['emits_per_second']
+            if report else 1.0,
+        })
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Measure how signal emits scale with threads.')
+    parser.add_argument('--threads', type=int, nargs='*')
+    parser.add_argument('--emits', type=int, default=20000,
+                        help='emits per thread')
+    parser.add_argument('--slots', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    print('free-threaded: %s' % FREE_THREADED)
+    print('%8s %12s %16s %8s' % ('threads', 'elapsed', 'emits/s', 'speedup'))
+    for r in run(args.threads or None, args.emits, args.slots):
+        print('%(threads)8d %(elapsed)11.3fs %(emits_per_second)16.0f '
+              '%(speedup)7.2fx' % r)
+    return 0
+
+
+if __name__ == '__main__':  # pragma: no cover
+    raise SystemExit(main())
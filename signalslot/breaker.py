@@ -0,0 +1,135 @@
+"""
+Module defining the CircuitBreaker class.
+"""
+
+import threading
+import time
+
+
+class CircuitBreaker(object):
+    """
+    A circuit breaker guards one slot connected to a signal and skips it
+    for ``cooldown`` seconds after ``max_failures`` consecutive failures,
+    ie.:
+
+    >>> from signalslot import Signal
+    >>> changed = Signal()
+    >>> def flaky(**kwargs):
+    ...     raise RuntimeError('down')
+    ...
+    >>> def steady(**kwargs):
+    ...     print('steady called')
+    ...
+    >>> breaker = CircuitBreaker(max_failures=2, cooldown=30, isolate=True)
+    >>> changed.connect(flaky, breaker=breaker)
+    >>> changed.connect(steady)
+    >>> changed.emit()
+    steady called
+    >>> changed.emit()
+    steady called
+    >>> breaker.is_open
+    True
+
+    A call fails when the slot raises an exception or, if ``latency`` is
+    set, when it runs for more than ``latency`` seconds. Once the cooldown
+    is over, one call is let through: the breaker closes again if it
+    succeeds and opens for another cooldown otherwise.
+
+    If ``isolate`` is true, exceptions raised by the slot are stored in
+    :py:attr:`last_exception` instead of being propagated, so that the
+    following slots are still called. Skipped and failed calls return None.
+
+    State is kept in a few counters on the breaker, a breaker cannot be
+    shared between slots: connecting it with a second slot raises
+    ValueError.
+    """
+    __slots__ = ('slot', 'max_failures', 'latency', 'cooldown', 'isolate',
+                 'timer', 'failures', 'opened_at', 'probing', 'skipped',
+                 'last_exception', '_lock')
+
+    def __init__(self, max_failures=5, latency=None, cooldown=60,
+                 isolate=False, timer=time.monotonic):
+        self.slot = None
+        self.max_failures = max_failures
+        self.latency = latency
+        self.cooldown = cooldown
+        self.isolate = isolate
+        self.timer = timer
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+        self.skipped = 0
+        self.last_exception = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        """
+        Return True if calls to the slot are currently skipped.
+        """
+        if self.opened_at is None:
+            return False
+        return self.probing or \
+            self.timer() < self.opened_at + self.cooldown
+
+    def __call__(self, *args, **kwargs):
+        """
+        Call the slot unless the breaker is open.
+        """
+        probe = False
+        if self.opened_at is not None:
+            with self._lock:
+                if self.is_open:
+                    self.skipped += 1
+                    return None
+                # Only one thread gets to probe.
+                self.probing = probe = True
+
+        latency = self.latency
+        if latency is not None:
+            started = self.timer()
+
+        try:
+            result = self.slot(*args, **kwargs)
+        except Exception as e:
+            self._failed(probe)
+            if not self.isolate:
+                raise
+            self.last_exception = e
+            return None
+        except BaseException:
+            # Interrupted, ie. by KeyboardInterrupt or a green thread
+            # timeout: this is not a failure of the slot, but a probe
+            # must not stay in progress forever.
+            if probe:
+                with self._lock:
+                    self.opened_at = self.timer()
+                    self.probing = False
+            raise
+
+        if latency is not None and self.timer() - started > latency:
+            self._failed(probe)
+        elif probe or self.failures:
+            with self._lock:
+                if probe:
+                    self.opened_at = None
+                    self.probing = False
+                if self.opened_at is None:
+                    self.failures = 0
+        return result
+
+    def _failed(self, probe):
+        """
+        Count a failure and open the breaker if it was probing or if there
+        are too many.
+        """
+        with self._lock:
+            self.failures += 1
+            if probe or (self.opened_at is None and
+                         self.failures >= self.max_failures):
+                self.opened_at = self.timer()
+                self.probing = False
+
+    def __repr__(self):
+        return '<signalslot.CircuitBreaker: %s %s>' % (
+            'open' if self.is_open else 'closed', self.slot)
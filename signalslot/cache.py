@@ -0,0 +1,100 @@
+"""
+Module defining the EmitCache class.
+"""
+
+import collections
+import threading
+import time
+
+
+class EmitCache(object):
+    """
+    Bounded cache of :py:meth:`~signalslot.signal.Signal.emit` results,
+    for signals whose slots are pure functions of their keyword arguments.
+
+    Pass an instance as the ``cache`` argument of a
+    :py:class:`~signalslot.signal.Signal`, ie.:
+
+    >>> from signalslot import Signal
+    >>> need_something = Signal(cache=EmitCache(maxsize=100, ttl=60))
+    >>> def get_something(name, **kwargs):
+    ...     print('computing %s' % name)
+    ...     return name.upper()
+    ...
+    >>> need_something.connect(get_something)
+    >>> need_something.emit(name='foo')
+    computing foo
+    'FOO'
+    >>> need_something.emit(name='foo')
+    'FOO'
+    >>> need_something.cache.hits, need_something.cache.misses
+    (1, 1)
+
+    Up to ``maxsize`` results are kept, least recently used first out. If
+    ``ttl`` is set, results older than ``ttl`` seconds are not reused.
+    Emits with unhashable keyword arguments are never cached. The cache is
+    cleared when a slot is connected to or disconnected from the signal, or
+    when a weak slot of the signal is found dead.
+    """
+    def __init__(self, maxsize=128, ttl=None, timer=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+        self._results = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key):
+        """
+        Return a ``(found, result)`` tuple for ``key``.
+        """
+        with self._lock:
+            try:
+                expires, result = self._results[key]
+            except KeyError:
+                self.misses += 1
+                return False, None
+
+            if expires is not None and expires <= self.timer():
+                del self._results[key]
+                self.misses += 1
+                return False, None
+
+            self._results.move_to_end(key)
+            self.hits += 1
+            return True, result
+
+    def store(self, key, result, generation=None):
+        """
+        Store ``result`` for ``key``, evicting the least recently used
+        result if the cache is full.
+
+        If ``generation`` is given, ``result`` is not stored if the cache
+        was cleared since :py:attr:`generation` had this value, as it may
+        have been computed with slots that changed since.
+        """
+        expires = None if self.ttl is None else self.timer() + self.ttl
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._results[key] = (expires, result)
+            self._results.move_to_end(key)
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+    def clear(self):
+        """
+        Forget every cached result, counters are kept.
+        """
+        with self._lock:
+            self._results.clear()
+            self.generation += 1
+
+    def __len__(self):
+        return len(self._results)
+
+    def __repr__(self):
+        return '<signalslot.EmitCache: %s/%s hits=%s misses=%s>' % (
+            len(self), self.maxsize, self.hits, self.misses)
@@ -0,0 +1,229 @@
+"""
+Module defining the Channel class.
+"""
+
+import collections
+import threading
+
+from .signal import BaseSlot
+
+
+# Overflow policies, see Channel.
+BLOCK = 'block'
+DROP_OLDEST = 'drop_oldest'
+DROP_NEWEST = 'drop_newest'
+COALESCE = 'coalesce'
+
+
+class Channel(BaseSlot):
+    """
+    A channel is a slot that queues the keyword arguments of emits in a
+    bounded buffer, for a consumer to call ``slot`` with them later, so
+    that a slow slot does not slow down the producer, ie.:
+
+    >>> from signalslot import Signal
+    >>> row_imported = Signal(args=['row'])
+    >>> def index_row(row, **kwargs):
+    ...     print('indexing row %s' % row)
+    ...
+    >>> channel = Channel(index_row, maxsize=2, overflow=DROP_OLDEST)
+    >>> row_imported.connect(channel)
+    >>> for row in range(3):
+    ...     row_imported.emit(row=row)
+    ...
+    >>> channel.depth, channel.dropped
+    (2, 1)
+    >>> channel.process()
+    indexing row 1
+    indexing row 2
+    2
+
+    :py:meth:`start` runs the consumer in a daemon thread, otherwise call
+    :py:meth:`process` from your own loop or coroutine.
+
+    ``overflow`` decides what happens to an emit when ``maxsize`` emits are
+    queued:
+
+    - ``DROP_NEWEST``, the default: the new emit is dropped,
+    - ``DROP_OLDEST``: the oldest queued emit is dropped,
+    - ``BLOCK``: the producer waits for the consumer, at most ``timeout``
+      seconds if set, then the new emit is dropped. Only use it with a
+      consumer in another thread, such as the one of :py:meth:`start`,
+      or the producer waits for itself,
+    - ``COALESCE``: a queued emit with the same values for the ``key``
+      arguments, all of them by default, is replaced by the new emit
+      whether the buffer is full or not. Otherwise the oldest queued emit
+      is dropped if the buffer is full.
+    """
+    def __init__(self, slot, maxsize=1024, overflow=DROP_NEWEST, key=None,
+                 timeout=None):
+        if overflow not in (BLOCK, DROP_OLDEST, DROP_NEWEST, COALESCE):
+            raise ValueError('Unknown overflow policy %r' % (overflow,))
+
+        self.slot = slot
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.key = key
+        self.timeout = timeout
+        self.dropped = 0
+        self.coalesced = 0
+        self.delivered = 0
+        self.errors = 0
+        self.max_depth = 0
+        self.last_exception = None
+        self._queue = collections.OrderedDict() if overflow == COALESCE \
+            else collections.deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._closed = False
+        self._thread = None
+
+    @property
+    def is_alive(self):
+        """
+        Return True until the channel is closed.
+        """
+        return not self._closed
+
+    @property
+    def func(self):
+        """
+        Return the function that is called by the consumer.
+        """
+        return self.slot
+
+    @property
+    def depth(self):
+        """
+        Return the number of queued emits.
+        """
+        return len(self._queue)
+
+    def __call__(self, **kwargs):
+        """
+        Queue an emit, according to the overflow policy.
+        """
+        with self._lock:
+            if self._closed:
+                self.dropped += 1
+                return None
+
+            queue = self._queue
+            if self.overflow == COALESCE:
+                names = self.key or sorted(kwargs)
+                try:
+                    key = tuple((name, kwargs.get(name)) for name in names)
+                    hash(key)
+                except TypeError:
+                    key = object()
+                if key in queue:
+                    queue[key] = kwargs
+                    self.coalesced += 1
+                    return None
+                if len(queue) >= self.maxsize:
+                    queue.popitem(last=False)
+                    self.dropped += 1
+                queue[key] = kwargs
+            elif len(queue) < self.maxsize:
+                queue.append(kwargs)
+            elif self.overflow == DROP_NEWEST:
+                self.dropped += 1
+                return None
+            elif self.overflow == DROP_OLDEST:
+                queue.popleft()
+                queue.append(kwargs)
+                self.dropped += 1
+            else:
+                self._not_full.wait_for(
+                    lambda: len(queue) < self.maxsize or self._closed,
+                    self.timeout)
+                if self._closed or len(queue) >= self.maxsize:
+                    self.dropped += 1
+                    return None
+                queue.append(kwargs)
+
+            if len(queue) > self.max_depth:
+                self.max_depth = len(queue)
+            self._not_empty.notify()
+
+    def get(self, block=True, timeout=None):
+        """
+        Return the keyword arguments of the oldest queued emit, None if
+        there is none within ``timeout`` or the channel is closed.
+        """
+        with self._lock:
+            if block:
+                self._not_empty.wait_for(
+                    lambda: self._queue or self._closed, timeout)
+            if not self._queue:
+                return None
+            if self.overflow == COALESCE:
+                kwargs = self._queue.popitem(last=False)[1]
+            else:
+                kwargs = self._queue.popleft()
+            self._not_full.notify()
+            return kwargs
+
+    def process(self, limit=None):
+        """
+        Call the slot for queued emits, at most ``limit``, without waiting.
+        Return the number of emits processed.
+        """
+        count = 0
+        while limit is None or count < limit:
+            kwargs = self.get(block=False)
+            if kwargs is None:
+                break
+            self._deliver(kwargs)
+            count += 1
+        return count
+
+    def _deliver(self, kwargs):
+        try:
+            self.slot(**kwargs)
+        except Exception as e:
+            self.errors += 1
+            self.last_exception = e
+        self.delivered += 1
+
+    def run(self):
+        """
+        Call the slot for every queued emit until the channel is closed and
+        its buffer is empty.
+        """
+        while True:
+            kwargs = self.get()
+            if kwargs is None:
+                return
+            self._deliver(kwargs)
+
+    def start(self):
+        """
+        Start consuming in a daemon thread.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.run)
+            self._thread.daemon = True
+            self._thread.start()
+
+    def close(self, timeout=None):
+        """
+        Stop queueing emits, wait for the consumer thread to process queued
+        emits, if any was started.
+        """
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def __eq__(self, other):
+        return self is other
+
+    __hash__ = object.__hash__
+
+    def __repr__(self):
+        return '<signalslot.Channel: %s %s/%s>' % (
+            self.slot, self.depth, self.maxsize)
@@ -1 +1 @@
-from .task import Task
+from .task import Task, TaskGroup
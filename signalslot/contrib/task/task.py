@@ -1,4 +1,5 @@
 import sys
+import time
 import eventlet
 import contexter
 import six
@@ -73,3 +74,92 @@ class Task(object):
 
     def __str__(self):
         return '%s: %s' % (self.signal.__class__.__name__, self.kwargs)
+
+
+class TaskGroupRun(object):
+    def __init__(self, pending=0):
+        self.succeeded = 0
+        self.failed = 0
+        self.pending = pending
+        self.latencies = []
+
+    def stats(self):
+        latencies = self.latencies
+        return {
+            'succeeded': self.succeeded,
+            'failed': self.failed,
+            'pending': self.pending,
+            'mean_latency': (sum(latencies) / len(latencies)
+                             if latencies else None),
+            'max_latency': max(latencies) if latencies else None,
+        }
+
+
+class TaskGroup(object):
+    def __init__(self, tasks=None, size=100, semaphores=None, logger=None):
+        self.tasks = list(tasks or [])
+        self.size = size
+        self.semaphores = semaphores or []
+        self.logger = logger
+        self.run = TaskGroupRun()
+
+    def add(self, task):
+        if task not in self.tasks:
+            self.tasks.append(task)
+
+    def __call__(self, timeout=None):
+        # Each call counts in its own run, so that tasks still running
+        # after a deadline do not update the counters of a later call.
+        run = self.run = TaskGroupRun(len(self.tasks))
+        pool = eventlet.GreenPool(self.size)
+        threads = []
+
+        with eventlet.Timeout(timeout, False):
+            for task in self.tasks:
+                threads.append(pool.spawn(self._run, run, task))
+            pool.waitall()
+
+        # Tasks still running after the deadline are killed, releasing the
+        # semaphores they hold, and stay pending.
+        for thread in threads:
+            thread.kill()
+
+        return run.pending == 0 and run.failed == 0
+
+    def _run(self, run, task):
+        started = time.time()
+        try:
+            result = task(semaphores=self.semaphores)
+        except Exception:
+            if self.logger:
+                self.logger.exception('[%s] Raised exception' % task)
+            result = False
+
+        run.latencies.append(time.time() - started)
+        run.pending -= 1
+        if result:
+            run.succeeded += 1
+        else:
+            run.failed += 1
+
+    @property
+    def succeeded(self):
+        return self.run.succeeded
+
+    @property
+    def failed(self):
+        return self.run.failed
+
+    @property
+    def pending(self):
+        return self.run.pending
+
+    @property
+    def latencies(self):
+        return self.run.latencies
+
+    def stats(self):
+        return self.run.stats()
+
+    def __str__(self):
+        return 'TaskGroup: %s tasks' % len(self.tasks)
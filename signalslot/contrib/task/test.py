@@ -4,7 +4,7 @@ import logging
 import eventlet
 import time
 from signalslot import Signal
-from signalslot.contrib.task import Task
+from signalslot.contrib.task import Task, TaskGroup
 
 eventlet.monkey_patch(time=True)
 
@@ -182,3 +182,112 @@ class TestTask(object):
         assert task_mock.failures == 0
         task_mock()
         assert task_mock.failures == 0
+
+
+class TestTaskGroup(object):
+    def get_task(self, duration=0, fail=False):
+        signal = mock.Mock()
+
+        def emit(**kwargs):
+            time.sleep(duration)
+            if fail:
+                raise Exception('die!')
+
+        signal.emit.side_effect = emit
+        return Task(signal, dict(duration=duration, fail=fail),
+                    logger=logging.getLogger('TestTaskGroup'))
+
+    def test_all_succeed(self):
+        group = TaskGroup([self.get_task(), self.get_task(.1)])
+
+        assert group() is True
+        assert group.stats()['succeeded'] == 2
+        assert group.stats()['max_latency'] >= .1
+
+    def test_failures(self):
+        group = TaskGroup([self.get_task(), self.get_task(fail=True)])
+
+        assert group() is False
+        assert group.succeeded == 1
+        assert group.failed == 1
+
+    def test_exception_without_logger(self):
+        signal = mock.Mock()
+        signal.emit.side_effect = Exception('die!')
+        group = TaskGroup([Task(signal)])
+
+        assert group() is False
+        assert group.failed == 1
+
+    def test_runs_concurrently(self):
+        group = TaskGroup([self.get_task(.2) for i in range(5)])
+        started = time.time()
+
+        group()
+
+        assert time.time() - started < .5
+
+    def test_bounded_concurrency(self):
+        group = TaskGroup([self.get_task(.1) for i in range(4)], size=2)
+        started = time.time()
+
+        group()
+
+        assert time.time() - started >= .2
+
+    def test_shared_semaphores(self):
+        semaphore = eventlet.semaphore.Semaphore(1)
+        group = TaskGroup([self.get_task(.1) for i in range(3)],
+                          semaphores=[semaphore])
+        started = time.time()
+
+        group()
+
+        assert time.time() - started >= .3
+
+    def test_deadline(self):
+        group = TaskGroup([self.get_task(), self.get_task(.5)])
+        started = time.time()
+
+        assert group(timeout=.1) is False
+        assert time.time() - started < .3
+        assert group.stats()['pending'] == 1
+        assert group.succeeded == 1
+
+    def test_deadline_with_busy_pool(self):
+        group = TaskGroup([self.get_task(.3) for i in range(4)], size=1)
+        started = time.time()
+
+        assert group(timeout=.1) is False
+        assert time.time() - started < .25
+        assert group.pending == 4
+
+    def test_reuse_after_deadline(self):
+        group = TaskGroup([self.get_task(.2)])
+        assert group(timeout=.05) is False
+        first = group.run
+
+        assert group() is True
+        time.sleep(.3)
+
+        assert group.stats()['pending'] == 0
+        assert group.succeeded == 1
+        assert first.succeeded == 0
+        assert first.pending == 1
+
+    def test_deadline_releases_semaphores(self):
+        semaphore = eventlet.semaphore.Semaphore(1)
+        group = TaskGroup([self.get_task(.5)], semaphores=[semaphore])
+
+        assert group(timeout=.05) is False
+
+        assert semaphore.balance == 1
+        assert group.pending == 1
+
+    def test_add_does_not_duplicate(self):
+        group = TaskGroup()
+        task = self.get_task()
+        group.add(task)
+        group.add(task)
+
+        assert len(group.tasks) == 1
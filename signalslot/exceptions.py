@@ -15,6 +15,54 @@ class SlotMustAcceptKeywords(SignalSlotException):
         super(SlotMustAcceptKeywords, self).__init__(m)
 
 
+class ForwardingCycle(SignalSlotException):
+    """
+    Raised when forwarding a signal to another signal which already
+    forwards to it.
+    """
+    def __init__(self, signal, other):
+        m = 'Cannot forward %s to %s because it forwards to %s' % (
+            signal, other, signal)
+
+        super(ForwardingCycle, self).__init__(m)
+
+
+class SlotNotImportable(SignalSlotException):
+    """
+    Raised when saving the wiring of a slot that cannot be imported back by
+    its module and qualified name.
+    """
+    def __init__(self, signal, slot):
+        m = 'Cannot save wiring of %s to %s because it is not importable' % (
+            slot, signal)
+
+        super(SlotNotImportable, self).__init__(m)
+
+
+class SlotOptionNotSaved(SignalSlotException):
+    """
+    Raised when saving the wiring of a slot connected with an option that
+    cannot be saved, such as an owner or a circuit breaker.
+    """
+    def __init__(self, signal, slot, option):
+        m = 'Cannot save wiring of %s to %s because of its %s' % (
+            slot, signal, option)
+
+        super(SlotOptionNotSaved, self).__init__(m)
+
+
+class WiringMismatch(SignalSlotException):
+    """
+    Raised when loading the wiring of a slot whose code changed since the
+    wiring was saved.
+    """
+    def __init__(self, signal, path):
+        m = 'Cannot connect %s to %s because its code changed' % (
+            path, signal)
+
+        super(WiringMismatch, self).__init__(m)
+
+
 # Not yet being used.
 class QueueCantQueueNonSignalInstance(SignalSlotException):  # pragma: no cover
     """
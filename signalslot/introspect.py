@@ -0,0 +1,146 @@
+"""
+Module to inspect the wiring of every live signal, to find leaks.
+
+Strong slots, which are plain callables or
+:py:class:`~signalslot.slot.Slot` objects created with ``weak=False``, keep
+what they reference alive as long as their signal is alive: the instance of
+a bound method, the cells of a closure, the arguments of a partial.
+:py:func:`wiring_report` lists every live signal with its slot counts and
+an estimate of the memory held by its strong slots, ie.:
+
+>>> from signalslot import Signal
+>>> class Cache(object):
+...     def __init__(self):
+...         self.data = list(range(1000))
+...
+...     def on_flush(self, **kwargs):
+...         pass
+...
+>>> flushed = Signal(name='flushed')
+>>> flushed.connect(Cache().on_flush)
+>>> report = [r for r in wiring_report() if r['name'] == 'flushed'][0]
+>>> report['strong'], report['weak'], report['dead']
+(1, 0, 0)
+>>> report['retained_bytes'] > 8000
+True
+
+:py:func:`format_report` renders a report as a text table, the report
+itself only holds numbers and strings so it can be dumped as JSON.
+"""
+
+import functools
+import gc
+import sys
+import types
+
+from .signal import BaseSlot, _signals
+from .slot import Slot
+
+
+# Do not count what is shared by the whole process.
+_SHARED_TYPES = (type, types.ModuleType, types.FunctionType,
+                 types.BuiltinFunctionType, types.CodeType)
+
+
+def live_signals():
+    """
+    Return the list of every :py:class:`~signalslot.signal.Signal` that
+    is still alive.
+    """
+    return list(_signals.values())
+
+
+def _roots(func):
+    """
+    Return the objects a strong slot ``func`` keeps alive on its own.
+    """
+    if isinstance(func, types.MethodType):
+        return [func.__self__]
+    if isinstance(func, functools.partial):
+        return [func.func] + list(func.args) + list(func.keywords.values())
+    if isinstance(func, types.FunctionType):
+        return [cell.cell_contents for cell in (func.__closure__ or ())
+                if cell.cell_contents is not func]
+    # Any other callable object is kept alive itself.
+    return [func]
+
+
+def retained_size(roots, seen=None, limit=100000):
+    """
+    Return the approximate size in bytes of the objects reachable from
+    ``roots``, not counting classes, modules, functions and the objects in
+    ``seen``. At most ``limit`` objects are visited.
+    """
+    seen = set() if seen is None else seen
+    size = 0
+    stack = list(roots)
+    while stack and limit:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _SHARED_TYPES):
+            continue
+        seen.add(id(obj))
+        limit -= 1
+        size += sys.getsizeof(obj)
+        stack.extend(gc.get_referents(obj))
+    return size
+
+
+def signal_report(signal):
+    """
+    Return a dict describing the slots connected to ``signal``.
+    """
+    strong = weak = dead = 0
+    seen = set()
+    size = 0
+    with signal._slots_lk:
+        slots = list(signal._slots.values())
+        forwards = len(signal._forwards)
+
+    for slot in slots:
+        if isinstance(slot, BaseSlot) and not slot.is_alive:
+            dead += 1
+        elif isinstance(slot, Slot) and slot._weak:
+            weak += 1
+        else:
+            strong += 1
+            func = slot.func if isinstance(slot, Slot) else slot
+            size += retained_size(_roots(func), seen)
+
+    return {
+        'id': id(signal),
+        'name': signal.name,
+        'slots': len(slots),
+        'strong': strong,
+        'weak': weak,
+        'dead': dead,
+        'forwards': forwards,
+        'retained_bytes': size,
+    }
+
+
+def wiring_report(signals=None):
+    """
+    Return a list of :py:func:`signal_report` for ``signals``, every live
+    signal by default, largest retained size first.
+    """
+    if signals is None:
+        signals = live_signals()
+    report = [signal_report(signal) for signal in signals]
+    report.sort(key=lambda r: r['retained_bytes'], reverse=True)
+    return report
+
+
+def format_report(report):
+    """
+    Return ``report`` from :py:func:`wiring_report` as a text table.
+    """
+    columns = ('name', 'slots', 'strong', 'weak', 'dead', 'forwards',
+               'retained_bytes')
+    rows = [columns] + [
+        tuple(str(r[c] if r[c] is not None else 'NO_NAME') for c in columns)
+        for r in report]
+    widths = [max(len(row[i]) for row in rows) for i in range(len(columns))]
+    return '\n'.join(
+        '  '.join(value.ljust(width) if i == 0 else value.rjust(width)
+                  for i, (value, width) in enumerate(zip(row, widths)))
+        for row in rows)
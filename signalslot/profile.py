@@ -0,0 +1,210 @@
+"""
+Sampling profiler for signal emits.
+
+Timing every slot call of a hot signal costs more than the slots
+themselves. Instead, :py:meth:`~signalslot.signal.Signal.profile` times
+only one emit out of ``every``, ie.:
+
+>>> from signalslot import Signal
+>>> request_started = Signal(name='request_started')
+>>> def log_request(**kwargs):
+...     pass
+...
+>>> request_started.connect(log_request)
+>>> profiler = Profiler()
+>>> request_started.profile(every=10, profiler=profiler)
+>>> for i in range(100):
+...     request_started.emit()
+...
+>>> [(s['signal'], s['calls']) for s in profiler.top_slots()]
+[('request_started', 10)]
+
+Times of every slot and emit are aggregated per signal name and slot name.
+:py:meth:`Profiler.dump` writes them as JSON, which can be reported with::
+
+    python -m signalslot.profile profile.json --top 20
+"""
+
+import argparse
+import json
+import sys
+import threading
+
+from .breaker import CircuitBreaker
+from .signal import BaseSlot, _Limit
+
+
+def slot_name(slot):
+    """
+    Return a stable name for ``slot``, unwrapping breakers and slots.
+    """
+    while isinstance(slot, (BaseSlot, CircuitBreaker, _Limit)):
+        slot = slot.func if isinstance(slot, BaseSlot) else slot.slot
+        if slot is None:
+            return 'dead'
+    name = getattr(slot, '__qualname__', None)
+    if name is None:
+        return repr(slot)
+    return '%s.%s' % (getattr(slot, '__module__', '?'), name)
+
+
+def signal_name(signal):
+    """
+    Return the name of ``signal``, ``NO_NAME`` if it has none.
+    """
+    return signal.name or 'NO_NAME'
+
+
+class _Stats(object):
+    """
+    Aggregated times of sampled calls.
+    """
+    __slots__ = ('calls', 'wall', 'cpu', 'max_wall')
+
+    def __init__(self, calls=0, wall=0.0, cpu=0.0, max_wall=0.0):
+        self.calls = calls
+        self.wall = wall
+        self.cpu = cpu
+        self.max_wall = max_wall
+
+    def add(self, wall, cpu):
+        self.calls += 1
+        self.wall += wall
+        self.cpu += cpu
+        if wall > self.max_wall:
+            self.max_wall = wall
+
+    def as_dict(self):
+        return {
+            'calls': self.calls,
+            'wall': self.wall,
+            'cpu': self.cpu,
+            'max_wall': self.max_wall,
+            'mean_wall': self.wall / self.calls if self.calls else 0.0,
+        }
+
+
+class Profiler(object):
+    """
+    Aggregate wall and CPU times of sampled emits, per signal and per slot.
+    """
+    def __init__(self):
+        self.signals = {}
+        self.slots = {}
+        self._lock = threading.Lock()
+
+    def record_slot(self, signal, slot, wall, cpu):
+        """
+        Add the times of one call of ``slot`` by ``signal``.
+        """
+        key = (signal_name(signal), slot_name(slot))
+        with self._lock:
+            stats = self.slots.get(key)
+            if stats is None:
+                stats = self.slots[key] = _Stats()
+            stats.add(wall, cpu)
+
+    def record_emit(self, signal, wall, cpu):
+        """
+        Add the times of one emit of ``signal``.
+        """
+        key = signal_name(signal)
+        with self._lock:
+            stats = self.signals.get(key)
+            if stats is None:
+                stats = self.signals[key] = _Stats()
+            stats.add(wall, cpu)
+
+    def top_slots(self, k=10, key='mean_wall'):
+        """
+        Return the ``k`` slowest slots by ``key``, as dicts.
+        """
+        with self._lock:
+            stats = [dict(s.as_dict(), signal=signal, slot=slot)
+                     for (signal, slot), s in self.slots.items()]
+        return sorted(stats, key=lambda s: s[key], reverse=True)[:k]
+
+    def top_signals(self, k=10, key='mean_wall'):
+        """
+        Return the ``k`` slowest signals by ``key``, as dicts.
+        """
+        with self._lock:
+            stats = [dict(s.as_dict(), signal=signal)
+                     for signal, s in self.signals.items()]
+        return sorted(stats, key=lambda s: s[key], reverse=True)[:k]
+
+    def clear(self):
+        """
+        Forget every sample.
+        """
+        with self._lock:
+            self.signals.clear()
+            self.slots.clear()
+
+    def dump(self, fp):
+        """
+        Write samples to the file object ``fp`` as JSON.
+        """
+        with self._lock:
+            data = {
+                'signals': [dict(signal=signal, **s.as_dict())
+                            for signal, s in self.signals.items()],
+                'slots': [dict(signal=signal, slot=slot, **s.as_dict())
+                          for (signal, slot), s in self.slots.items()],
+            }
+        json.dump(data, fp, indent=1, sort_keys=True)
+
+    @classmethod
+    def load(cls, fp):
+        """
+        Return a profiler with the samples read from the file object
+        ``fp``, written by :py:meth:`dump`.
+        """
+        data = json.load(fp)
+        profiler = cls()
+        fields = ('calls', 'wall', 'cpu', 'max_wall')
+        for s in data['signals']:
+            profiler.signals[s['signal']] = _Stats(*[s[f] for f in fields])
+        for s in data['slots']:
+            profiler.slots[(s['signal'], s['slot'])] = _Stats(
+                *[s[f] for f in fields])
+        return profiler
+
+
+default_profiler = Profiler()
+
+
+def format_top(profiler, k=10, key='mean_wall'):
+    """
+    Return the ``k`` slowest signals and slots of ``profiler`` as text.
+    """
+    lines = ['Slowest signals by %s:' % key]
+    for s in profiler.top_signals(k, key):
+        lines.append('  %(mean_wall)12.6fs %(max_wall)12.6fs %(calls)8d  '
+                     '%(signal)s' % s)
+    lines.append('Slowest slots by %s:' % key)
+    for s in profiler.top_slots(k, key):
+        lines.append('  %(mean_wall)12.6fs %(max_wall)12.6fs %(calls)8d  '
+                     '%(signal)s: %(slot)s' % s)
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Report the slowest signals and slots of a profile '
+                    'dumped by signalslot.profile.Profiler.dump().')
+    parser.add_argument('dump', help='JSON file written by Profiler.dump()')
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--key', default='mean_wall',
+                        choices=['mean_wall', 'max_wall', 'wall', 'cpu',
+                                 'calls'])
+    args = parser.parse_args(argv)
+
+    with open(args.dump) as fp:
+        profiler = Profiler.load(fp)
+    sys.stdout.write(format_top(profiler, args.top, args.key) + '\n')
+    return 0
+
+
+if __name__ == '__main__':  # pragma: no cover
+    raise SystemExit(main())
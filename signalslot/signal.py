@@ -2,12 +2,34 @@
 Module defining the Signal class.
 """
 
+import collections
+import contextlib
+import functools
+import heapq
 import inspect
+import itertools
+import sys
 import threading
+import time
+import types
+import weakref
 
 from . import exceptions
 
 
+# True on free-threaded builds of CPython running without the GIL.
+FREE_THREADED = not getattr(sys, '_is_gil_enabled', lambda: True)()
+
+# Time spent by this thread only, when available.
+_cpu_time = getattr(time, 'thread_time', time.process_time)
+
+# Calling conventions of slots, see Signal.connect().
+KWARGS = 'kwargs'
+MAPPING = 'mapping'
+ARGS = 'args'
+BATCH = 'batch'
+
+
 class DummyLock(object):
     """
     Class that implements a no-op instead of a re-entrant lock.
@@ -27,6 +49,247 @@ class BaseSlot(object):
     pass
 
 
+# Every live signal by id, see signalslot.introspect.
+_signals = weakref.WeakValueDictionary()
+
+# Connections recorded with an owner, by id of the owner then by id of the
+# signal and of the slot, and the finalizer dropping them with the owner.
+_owned = {}
+_owner_finalizers = {}
+_owned_lk = threading.Lock()
+
+
+def _forget_owner(key):
+    """
+    Drop the connections of the owner ``key``, called when it is collected.
+    """
+    # No lock: the garbage collector may run this while it is held.
+    _owned.pop(key, None)
+    _owner_finalizers.pop(key, None)
+
+
+def _pop_owner(key):
+    """
+    Drop the connections of the owner ``key`` and return them, detaching
+    its finalizer. Must be called with ``_owned_lk``.
+    """
+    finalizer = _owner_finalizers.pop(key, None)
+    if finalizer is not None:
+        finalizer.detach()
+    return _owned.pop(key, {})
+
+
+def _own(owner, signal, slot_id):
+    """
+    Record that ``owner`` connected the slot ``slot_id`` to ``signal``.
+    """
+    key = id(owner)
+    with _owned_lk:
+        connections = _owned.get(key)
+        if connections is None:
+            _owner_finalizers[key] = weakref.finalize(
+                owner, _forget_owner, key)
+            connections = _owned[key] = {}
+        connections[(id(signal), slot_id)] = weakref.ref(signal)
+    return key
+
+
+def _disown(key, signal, slot_id):
+    """
+    Forget that the slot ``slot_id`` of ``signal`` is owned.
+    """
+    with _owned_lk:
+        connections = _owned.get(key)
+        if connections is not None:
+            connections.pop((id(signal), slot_id), None)
+            if not connections:
+                _pop_owner(key)
+
+
+def disconnect_owner(owner):
+    """
+    Disconnect every slot connected with ``owner``, from every signal, ie.:
+
+    >>> class Widget(object):
+    ...     def on_update(self, **kwargs):
+    ...         print('updated')
+    ...
+    >>> update = Signal()
+    >>> widget = Widget()
+    >>> update.connect(widget.on_update, owner=widget)
+    >>> disconnect_owner(widget)
+    >>> update.emit()
+
+    This takes time proportional to the number of connections of
+    ``owner``.
+    """
+    with _owned_lk:
+        connections = _pop_owner(id(owner))
+
+    for (signal_id, slot_id), signal_ref in connections.items():
+        signal = signal_ref()
+        if signal is not None:
+            signal._remove(slot_id)
+
+
+class _ThreadStats(object):
+    """
+    Emit counters of one thread, only written by that thread.
+    """
+    __slots__ = ('thread', 'name', 'emits')
+
+    def __init__(self, thread):
+        self.thread = weakref.ref(thread)
+        self.name = thread.name
+        self.emits = 0
+
+    @property
+    def finished(self):
+        thread = self.thread()
+        return thread is None or not thread.is_alive()
+
+
+class _Recorder(object):
+    """
+    Record emits of blocked signals to replay them later.
+    """
+    def __init__(self, coalesce):
+        self.coalesce = bool(coalesce)
+        self.emits = collections.OrderedDict() if coalesce else []
+        self.lock = threading.Lock()
+
+    def record(self, signal, kwargs):
+        with self.lock:
+            if self.coalesce:
+                self.emits[id(signal)] = (signal, kwargs)
+                self.emits.move_to_end(id(signal))
+            else:
+                self.emits.append((signal, kwargs))
+
+    def flush(self):
+        with self.lock:
+            emits = self.emits
+            if self.coalesce:
+                emits = list(emits.values())
+            self.emits = collections.OrderedDict() if self.coalesce else []
+
+        for signal, kwargs in emits:
+            signal.emit(**kwargs)
+
+
+def _check_coalesce(recorder, coalesce):
+    """
+    Raise if a nested blocking context does not coalesce like ``recorder``.
+    """
+    if recorder.coalesce != bool(coalesce):
+        raise ValueError('Cannot block with coalesce=%r inside a context '
+                         'blocking with coalesce=%r' % (
+                             coalesce, recorder.coalesce))
+
+
+# Recorder of every signal while blocked_signals() is active.
+_recorder = None
+_recorder_lk = threading.Lock()
+
+
+@contextlib.contextmanager
+def blocked_signals(coalesce=True):
+    """
+    Block every signal in this context, see :py:meth:`Signal.blocked`.
+
+    >>> saved = Signal()
+    >>> def on_saved(row, **kwargs):
+    ...     print('saved %s' % row)
+    ...
+    >>> saved.connect(on_saved)
+    >>> with blocked_signals():
+    ...     for row in range(3):
+    ...         saved.emit(row=row)
+    ...
+    saved 2
+
+    Like :py:meth:`Signal.blocked`, this is not per thread: emits of every
+    thread are recorded until the outermost context exits.
+    """
+    global _recorder
+
+    with _recorder_lk:
+        recorder = _recorder
+        if recorder is None:
+            recorder = _recorder = _Recorder(coalesce)
+            outer = True
+        else:
+            _check_coalesce(recorder, coalesce)
+            outer = False
+
+    if not outer:
+        yield
+        return
+
+    try:
+        yield
+    except BaseException:
+        _recorder = None
+        raise
+
+    _recorder = None
+    recorder.flush()
+
+
+def _max_calls(once, max_calls):
+    """
+    Return the call limit of a connection, raise if it is invalid.
+    """
+    if once and max_calls is not None:
+        raise ValueError('Cannot pass both once and max_calls')
+    if once:
+        return 1
+    if max_calls is not None and max_calls < 1:
+        raise ValueError('max_calls must be at least 1, not %r' % (
+            max_calls,))
+    return max_calls
+
+
+# Versions of the slots of signals, unique across signals and threads.
+_versions = itertools.count()
+
+# Serializes Signal.forward_to() calls.
+_forwarding_lk = threading.Lock()
+
+
+def _drop_upstream(upstream, key, ref):
+    """
+    Forget the garbage collected signal ``key`` that forwarded to the
+    signal whose ``_upstream`` is ``upstream``.
+    """
+    if upstream.get(key) is ref:
+        del upstream[key]
+
+
+class _Limit(object):
+    """
+    Call a slot at most ``calls_left`` times, then disconnect it.
+    """
+    __slots__ = ('signal', 'slot_id', 'slot', 'calls_left')
+
+    def __init__(self, signal, slot_id, slot, calls_left):
+        self.signal = signal
+        self.slot_id = slot_id
+        self.slot = slot
+        self.calls_left = calls_left
+
+    def __call__(self, *args, **kwargs):
+        with self.signal._slots_lk:
+            if self.calls_left <= 0:
+                return None
+            self.calls_left -= 1
+            if not self.calls_left:
+                # Emits in progress keep their snapshot, others won't see
+                # this slot anymore.
+                self.signal._remove(self.slot_id)
+        return self.slot(*args, **kwargs)
+
+
 class Signal(object):
     """
     Define a signal by instanciating a :py:class:`Signal` object, ie.:
@@ -64,12 +327,46 @@ class Signal(object):
     >>> conf_pre_load.disconnect(yourmodule_conf)
     >>> conf_pre_load.is_connected(yourmodule_conf)
     False
+
+    If ``threadsafe`` is true, connecting and disconnecting slots is
+    serialized by a lock. Emits usually do not take it: they call slots
+    from an immutable snapshot that is rebuilt after slots change. By
+    default, the lock is only used on free-threaded builds of Python, see
+    :py:data:`FREE_THREADED`. Emits, circuit breakers and profiling do not
+    rely on the GIL, but this was not verified on such a build yet: the
+    tox environment ``py313t`` runs the tests, :py:mod:`signalslot.stress`
+    and :py:mod:`signalslot.benchmark` on one.
+
+    If ``stats`` is true, emits are counted per thread, without contention
+    between threads, see :py:meth:`emit_stats`.
     """
-    def __init__(self, args=None, name=None, threadsafe=False):
-        self._slots = []
+    def __init__(self, args=None, name=None, threadsafe=None, cache=None,
+                 stats=False):
+        if threadsafe is None:
+            threadsafe = FREE_THREADED
+        self._slots = collections.OrderedDict()
+        self._filters = {}
+        self._slot_owners = {}
+        self._breakers = {}
+        self._limits = {}
+        self._conventions = {}
+        self._dispatch = None
+        self._version = next(_versions)
+        self._recorder = None
+        self._profiler = None
+        self._sample_every = 0
+        self._sampling = None
+        self._forwards = collections.OrderedDict()
+        self._upstream = {}
+        self._stats = threading.local() if stats else None
+        self._thread_stats = []
+        self._finished_threads = 0
+        self._finished_emits = 0
         self._slots_lk = threading.RLock() if threadsafe else DummyLock()
         self.args = args or []
         self.name = name
+        self.cache = cache
+        _signals[id(self)] = self
 
     @property
     def slots(self):
@@ -77,41 +374,450 @@ class Signal(object):
         Return a list of slots for this signal.
         """
         with self._slots_lk:
-            # Do a slot clean-up
-            slots = []
-            for s in self._slots:
-                if isinstance(s, BaseSlot) and (not s.is_alive):
-                    continue
-                slots.append(s)
-            self._slots = slots
-            return list(slots)
+            self._purge()
+            return list(self._slots.values())
 
-    def connect(self, slot):
+    def connect(self, slot, match=None, owner=None, breaker=None,
+                once=False, max_calls=None, convention=KWARGS):
         """
         Connect a callback ``slot`` to this signal.
+
+        If ``match`` is a dict, the slot is only called by :py:meth:`emit`
+        when every key of ``match`` is passed as a keyword argument with an
+        equal value:
+
+        >>> tenant_changed = Signal(args=['tenant_id'])
+        >>> def tenant_42(tenant_id, **kwargs):
+        ...     print('tenant %s changed' % tenant_id)
+        ...
+        >>> tenant_changed.connect(tenant_42, match={'tenant_id': 42})
+        >>> tenant_changed.emit(tenant_id=1)
+        >>> tenant_changed.emit(tenant_id=42)
+        tenant 42 changed
+
+        Filtered slots are kept in a hash index, so the cost of an emit
+        does not grow with the number of slots filtering on other values.
+
+        If ``owner`` is given, the connection is recorded for
+        :py:func:`disconnect_owner`. The owner must support weak
+        references, its record is dropped when it is garbage collected.
+
+        If ``breaker`` is a :py:class:`~signalslot.breaker.CircuitBreaker`,
+        :py:meth:`emit` calls the slot through it. A breaker guards one slot
+        only, ValueError is raised if it already guards another one.
+
+        If ``max_calls`` is set, it must be at least 1, the slot is
+        disconnected after it has been called that many times.
+        ``once=True`` is ``max_calls=1``, only one of them can be passed:
+
+        >>> response_received = Signal()
+        >>> def on_first_response(**kwargs):
+        ...     print('first response')
+        ...
+        >>> response_received.connect(on_first_response, once=True)
+        >>> response_received.emit()
+        first response
+        >>> response_received.emit()
+        >>> response_received.is_connected(on_first_response)
+        False
+
+        ``convention`` sets how :py:meth:`emit` passes arguments to the
+        slot. With the default, ``KWARGS``, the slot is called with keyword
+        arguments, which copies them for every slot. With ``MAPPING``, the
+        slot is called with a single read-only mapping shared by every slot
+        of the emit. With ``ARGS``, the slot is called with the values of
+        :py:attr:`args` as positional arguments, None for the missing ones.
+        Such slots do not need to accept ``**kwargs``:
+
+        >>> moved = Signal(args=['x', 'y'])
+        >>> def on_moved(x, y):
+        ...     print('moved to %s, %s' % (x, y))
+        ...
+        >>> def on_moved_mapping(event):
+        ...     print('moved to %(x)s, %(y)s' % event)
+        ...
+        >>> moved.connect(on_moved, convention=ARGS)
+        >>> moved.connect(on_moved_mapping, convention=MAPPING)
+        >>> moved.emit(x=1, y=2)
+        moved to 1, 2
+        moved to 1, 2
+
+        With ``BATCH``, the slot is called once per :py:meth:`emit_batch`
+        with whole columns of values, and by :py:meth:`emit` with each value
+        in a list of one item.
         """
-        if not isinstance(slot, BaseSlot) and \
-                inspect.getfullargspec(slot).varkw is None:
-            raise exceptions.SlotMustAcceptKeywords(self, slot)
+        self._check(slot, convention, match)
+        max_calls = _max_calls(once, max_calls)
+
+        with self._slots_lk:
+            if breaker is not None and breaker.slot is not None and \
+                    breaker.slot is not slot:
+                raise ValueError('%s already guards another slot' % (
+                    breaker,))
+            if self._add(slot, match, owner, breaker, max_calls, convention):
+                self._changed()
+
+    def connect_many(self, slots, match=None, owner=None, once=False,
+                     max_calls=None, convention=KWARGS):
+        """
+        Connect every callback of ``slots`` with the same options as
+        :py:meth:`connect`, taking the lock once.
+        """
+        slots = list(slots)
+        for slot in slots:
+            self._check(slot, convention, match)
+        max_calls = _max_calls(once, max_calls)
 
         with self._slots_lk:
-            if not self.is_connected(slot):
-                self._slots.append(slot)
+            added = [self._add(slot, match, owner, None, max_calls,
+                               convention)
+                     for slot in slots]
+            if any(added):
+                self._changed()
 
     def is_connected(self, slot):
         """
         Check if a callback ``slot`` is connected to this signal.
         """
         with self._slots_lk:
-            return slot in self._slots
+            return self._find(slot) is not None
 
     def disconnect(self, slot):
         """
         Disconnect a slot from a signal if it is connected else do nothing.
         """
         with self._slots_lk:
-            if self.is_connected(slot):
-                self._slots.pop(self._slots.index(slot))
+            slot_id = self._find(slot)
+            if slot_id is not None:
+                self._remove(slot_id)
+
+    def disconnect_many(self, slots):
+        """
+        Disconnect every connected slot of ``slots``, taking the lock once.
+        """
+        with self._slots_lk:
+            for slot in slots:
+                slot_id = self._find(slot)
+                if slot_id is not None:
+                    self._remove(slot_id)
+
+    def _load(self, connections):
+        """
+        Connect ``(slot, match, max_calls, convention)`` tuples in bulk
+        without validating slots, see :py:mod:`signalslot.wiring`.
+
+        Slots are compared with connected slots by the identity of their
+        function, in one pass, rather than with :py:meth:`_find`.
+        """
+        from .slot import Slot
+
+        def key(slot):
+            return id(slot.func) if isinstance(slot, Slot) else id(slot)
+
+        with self._slots_lk:
+            self._purge()
+            seen = set(key(slot) for slot in self._slots.values())
+            for slot, match, max_calls, convention in connections:
+                if key(slot) in seen:
+                    continue
+                seen.add(key(slot))
+                self._insert(slot, match, max_calls=max_calls,
+                             convention=convention)
+            self._changed()
+
+    def _options(self, slot_id):
+        """
+        Return the options the slot ``slot_id`` was connected with, as a
+        dict of ``match``, ``max_calls``, ``convention``, ``owner`` and
+        ``breaker``.
+        """
+        with self._slots_lk:
+            limit = self._limits.get(slot_id)
+            return {
+                'match': self._filters.get(slot_id),
+                'max_calls': limit.calls_left if limit else None,
+                'convention': self._conventions.get(slot_id, KWARGS),
+                'owner': slot_id in self._slot_owners,
+                'breaker': self._breakers.get(slot_id),
+            }
+
+    def forward_to(self, other):
+        """
+        Forward emits of this signal to the ``other`` signal, as if
+        ``other.emit`` was connected as a slot, ie.:
+
+        >>> low_level = Signal()
+        >>> high_level = Signal()
+        >>> def on_event(**kwargs):
+        ...     print('event %(code)s' % kwargs)
+        ...
+        >>> high_level.connect(on_event)
+        >>> low_level.forward_to(high_level)
+        >>> low_level.emit(code=3)
+        event 3
+
+        Chains of forwarded signals are flattened, so that an emit calls
+        the slots of every signal of the chain directly. Slots of forwarded
+        signals are called after the slots of this signal, in the order
+        signals were forwarded to. Raise
+        :py:exc:`~signalslot.exceptions.ForwardingCycle` if ``other``
+        forwards to this signal, directly or not.
+        """
+        # Checking for cycles and forwarding must be atomic across signals,
+        # or a.forward_to(b) and b.forward_to(a) could both succeed.
+        with _forwarding_lk:
+            if other is self or other._forwards_to(self):
+                raise exceptions.ForwardingCycle(self, other)
+
+            with self._slots_lk:
+                if id(other) in self._forwards:
+                    return
+                self._forwards[id(other)] = other
+                other._upstream[id(self)] = weakref.ref(
+                    self, functools.partial(
+                        _drop_upstream, other._upstream, id(self)))
+                self._changed()
+
+    def stop_forwarding_to(self, other):
+        """
+        Stop forwarding emits to the ``other`` signal if it was forwarded
+        to else do nothing.
+        """
+        with self._slots_lk:
+            if self._forwards.pop(id(other), None) is None:
+                return
+            other._upstream.pop(id(self), None)
+            self._changed()
+
+    def _forwards_to(self, other):
+        """
+        Return True if emits of this signal reach ``other`` by forwarding.
+        """
+        return any(signal is other or signal._forwards_to(other)
+                   for signal in list(self._forwards.values()))
+
+    def _purge(self):
+        """
+        Remove slots whose weakly referenced function was garbage collected.
+        """
+        dead = [slot_id for slot_id, s in self._slots.items()
+                if isinstance(s, BaseSlot) and (not s.is_alive)]
+        for slot_id in dead:
+            self._remove(slot_id)
+
+    def _check(self, slot, convention=KWARGS, match=None):
+        """
+        Raise if ``slot`` cannot be connected to this signal.
+        """
+        if convention not in (KWARGS, MAPPING, ARGS, BATCH):
+            raise ValueError('Unknown calling convention %r' % (convention,))
+        if convention == BATCH and match:
+            raise ValueError('Cannot filter slots of convention BATCH')
+        if match:
+            try:
+                hash(tuple(match.values()))
+            except TypeError:
+                raise TypeError('Cannot filter on unhashable values %r' % (
+                    match,))
+
+        if convention in (KWARGS, BATCH) and \
+                not isinstance(slot, BaseSlot) and \
+                inspect.getfullargspec(slot).varkw is None:
+            raise exceptions.SlotMustAcceptKeywords(self, slot)
+
+    def _find(self, slot):
+        """
+        Return the key of ``slot`` in ``_slots``, None if not connected.
+        """
+        slot_id = id(slot)
+        if slot_id in self._slots:
+            return slot_id
+        for slot_id, s in self._slots.items():
+            if s == slot:
+                return slot_id
+
+    def _add(self, slot, match=None, owner=None, breaker=None,
+             max_calls=None, convention=KWARGS):
+        """
+        Add ``slot`` unless it is connected, return True if it was added.
+        """
+        if self._find(slot) is not None:
+            return False
+        self._insert(slot, match, owner, breaker, max_calls, convention)
+        return True
+
+    def _insert(self, slot, match=None, owner=None, breaker=None,
+                max_calls=None, convention=KWARGS):
+        """
+        Store ``slot`` and its options, if its id is not stored yet.
+        """
+        slot_id = id(slot)
+        if slot_id in self._slots:
+            return
+        if owner is not None:
+            # First, as it raises if owner does not support weak references.
+            self._slot_owners[slot_id] = _own(owner, self, slot_id)
+        self._slots[slot_id] = slot
+        if match:
+            self._filters[slot_id] = dict(match)
+        if breaker is not None:
+            breaker.slot = slot
+            self._breakers[slot_id] = breaker
+        if convention != KWARGS:
+            self._conventions[slot_id] = convention
+        if max_calls is not None:
+            self._limits[slot_id] = _Limit(
+                self, slot_id, self._breakers.get(slot_id, slot), max_calls)
+
+    def _remove(self, slot_id):
+        """
+        Remove the slot stored under ``slot_id`` with its options.
+        """
+        with self._slots_lk:
+            if slot_id not in self._slots:
+                return
+            del self._slots[slot_id]
+            self._filters.pop(slot_id, None)
+            self._breakers.pop(slot_id, None)
+            self._limits.pop(slot_id, None)
+            self._conventions.pop(slot_id, None)
+            owner_key = self._slot_owners.pop(slot_id, None)
+            if owner_key is not None:
+                _disown(owner_key, self, slot_id)
+            self._changed()
+
+    def _changed(self):
+        """
+        Drop the dispatch snapshot and cached results after slots changed,
+        here and in every signal forwarding to this one.
+        """
+        self._version = next(_versions)
+        self._dispatch = None
+        if self.cache is not None:
+            self.cache.clear()
+        self._upstream_changed()
+
+    def _upstream_changed(self):
+        """
+        Call :py:meth:`_changed` on every signal forwarding to this one.
+        """
+        for signal_ref in list(self._upstream.values()):
+            signal = signal_ref()
+            if signal is not None:
+                signal._changed()
+
+    def _entries(self):
+        """
+        Return the flattened list of ``(convention, slot, match)`` to call
+        on emit, with the entries of forwarded signals after our own.
+
+        Slots with a circuit breaker or a call limit are replaced by the
+        object that wraps them. The ``ARGS`` convention is replaced by the
+        tuple of argument names of the signal the slot is connected to.
+        Forwarded signals that are blocked, cached, profiled or counted are
+        not flattened, their :py:meth:`emit` is called instead.
+        """
+        with self._slots_lk:
+            self._purge()
+            entries = []
+            # One tuple for every ARGS slot, so that _emit() builds their
+            # positional arguments once.
+            names = tuple(self.args)
+            for slot_id, slot in self._slots.items():
+                slot = self._limits.get(slot_id) or \
+                    self._breakers.get(slot_id, slot)
+                convention = self._conventions.get(slot_id, KWARGS)
+                if convention == ARGS:
+                    convention = names
+                entries.append((convention, slot, self._filters.get(slot_id)))
+
+            for other in self._forwards.values():
+                if other._flattenable():
+                    entries.extend(other._entries())
+                else:
+                    entries.append((KWARGS, other.emit, None))
+            return entries
+
+    def _flattenable(self):
+        """
+        Return True if signals forwarding to this one may call its slots
+        directly instead of calling :py:meth:`emit`.
+        """
+        return self.cache is None and self._recorder is None and \
+            not self._sample_every and self._stats is None
+
+    def _mortal(self):
+        """
+        Return the slots whose death changes the entries of
+        :py:meth:`_entries`, with those of flattened forwarded signals.
+        """
+        with self._slots_lk:
+            slots = [slot for slot in self._slots.values()
+                     if isinstance(slot, BaseSlot)]
+            for other in self._forwards.values():
+                if other._flattenable():
+                    slots.extend(other._mortal())
+            return slots
+
+    def _get_dispatch(self):
+        """
+        Return the dispatch snapshot, building it if slots changed.
+
+        The snapshot is a tuple of the unfiltered slots, the same slots
+        ranked in call order, and the index of filtered ranked slots by
+        matched keys then matched values. Slots are stored as
+        ``(convention, slot)`` and ranked slots as
+        ``(rank, convention, slot)``, see :py:meth:`_entries`. Last comes
+        the tuple of slots that may die, such as weak slots, of this
+        signal and of the signals it flattens.
+        """
+        stored = self._dispatch
+        if stored is not None and stored[0] == self._version:
+            return stored[1]
+
+        with self._slots_lk:
+            # A forwarded signal may change while we flatten it, without
+            # taking our lock: the snapshot is stored with the version it
+            # was built from, and only reused while that is current.
+            version = self._version
+            plain = []
+            index = {}
+            for rank, (convention, slot, match) in enumerate(
+                    self._entries()):
+                entry = (rank, convention, slot)
+                if match is None:
+                    plain.append(entry)
+                    continue
+                keys = tuple(sorted(match))
+                values = tuple(match[key] for key in keys)
+                index.setdefault(keys, {}).setdefault(
+                    values, []).append(entry)
+            dispatch = (tuple(entry[1:] for entry in plain),
+                        tuple(plain), index, tuple(self._mortal()))
+            self._dispatch = (version, dispatch)
+        return dispatch
+
+    def _select(self, kwargs):
+        """
+        Return the ``(convention, slot)`` pairs to call for ``kwargs``, in
+        connection order.
+        """
+        slots, ranked, index, mortal = self._get_dispatch()
+        if not index:
+            return slots
+
+        matched = []
+        for keys, table in index.items():
+            try:
+                bucket = table.get(tuple(kwargs[key] for key in keys))
+            except (KeyError, TypeError):
+                continue
+            if bucket:
+                matched.append(bucket)
+
+        if not matched:
+            return slots
+        return [entry[1:] for entry in heapq.merge(ranked, *matched)]
 
     def emit(self, **kwargs):
         """
@@ -132,13 +838,298 @@ class Signal(object):
         >>> need_something.connect(make_something)
         >>> need_something.emit()
         'got something'
+
+        If the signal has a ``cache``, see
+        :py:class:`~signalslot.cache.EmitCache`, the result of an emit is
+        reused by later emits with equal keyword arguments.
+
+        While the signal is blocked, see :py:meth:`blocked`, the emit is
+        recorded and None is returned.
         """
-        for slot in self.slots:
-            result = slot(**kwargs)
+        recorder = self._recorder or _recorder
+        if recorder is not None:
+            recorder.record(self, kwargs)
+            return None
 
-            if result is not None:
+        if self._stats is not None:
+            try:
+                self._stats.counters.emits += 1
+            except AttributeError:
+                self._count_thread().emits += 1
+
+        profiler = None
+        if self._sample_every:
+            profiler = self._sample()
+
+        cache = self.cache
+        if cache is not None:
+            try:
+                key = frozenset(kwargs.items())
+            except TypeError:
+                pass
+            else:
+                if not all(slot.is_alive
+                           for slot in self._get_dispatch()[3]):
+                    # A cached result may come from a dead weak slot.
+                    with self._slots_lk:
+                        self._changed()
+                generation = cache.generation
+                found, result = cache.lookup(key)
+                if not found:
+                    result = self._emit(kwargs, profiler=profiler)
+                    cache.store(key, result, generation)
                 return result
 
+        return self._emit(kwargs, profiler=profiler)
+
+    def _count_thread(self):
+        """
+        Return new emit counters for the current thread.
+        """
+        counters = _ThreadStats(threading.current_thread())
+        with self._slots_lk:
+            self._fold_finished()
+            self._thread_stats.append(counters)
+        self._stats.counters = counters
+        return counters
+
+    def _fold_finished(self):
+        """
+        Add the counters of finished threads to the totals, so that they
+        are not kept forever.
+        """
+        finished = [c for c in self._thread_stats if c.finished]
+        if finished:
+            self._thread_stats = [c for c in self._thread_stats
+                                  if not c.finished]
+            self._finished_threads += len(finished)
+            self._finished_emits += sum(c.emits for c in finished)
+
+    def emit_stats(self):
+        """
+        Return the number of emits of this signal, in total, per running
+        thread name and by finished threads, if it was created with
+        ``stats=True``:
+
+        >>> polled = Signal(stats=True)
+        >>> for i in range(3):
+        ...     polled.emit()
+        ...
+        >>> polled.emit_stats()['emits']
+        3
+
+        Counters of finished threads are only kept as totals.
+        """
+        with self._slots_lk:
+            self._fold_finished()
+            counters = list(self._thread_stats)
+            threads = self._finished_threads
+            finished = self._finished_emits
+        per_thread = collections.Counter()
+        for c in counters:
+            per_thread[c.name] += c.emits
+        return {
+            'emits': sum(per_thread.values()) + finished,
+            'threads': len(counters) + threads,
+            'per_thread': dict(per_thread),
+            'finished': finished,
+        }
+
+    def profile(self, every=100, profiler=None):
+        """
+        Time one emit out of ``every``, and each of its slot calls, in
+        ``profiler``, a :py:class:`~signalslot.profile.Profiler` which is
+        ``signalslot.profile.default_profiler`` by default.
+
+        Stop profiling if ``every`` is None.
+        """
+        if not every:
+            self._profiler = None
+            self._sample_every = 0
+        else:
+            if profiler is None:
+                from .profile import default_profiler as profiler
+            self._profiler = profiler
+            self._sampling = threading.local()
+            self._sample_every = every
+        # Forwarding signals must call our emit to sample it.
+        self._upstream_changed()
+
+    def _sample(self):
+        """
+        Return the profiler if this emit is sampled, else None.
+
+        Each thread samples one of every ``every`` of its own emits, so
+        that threads do not share a countdown.
+        """
+        sampling = self._sampling
+        countdown = getattr(sampling, 'countdown', self._sample_every) - 1
+        if countdown > 0:
+            sampling.countdown = countdown
+            return None
+        sampling.countdown = self._sample_every
+        return self._profiler
+
+    @contextlib.contextmanager
+    def blocked(self, coalesce=True):
+        """
+        Block this signal in this context: emits are recorded instead of
+        calling slots, and replayed when the context exits.
+
+        If ``coalesce`` is true, only the last emit is replayed, otherwise
+        every emit is replayed in order:
+
+        >>> row_saved = Signal(args=['row'])
+        >>> def on_row_saved(row, **kwargs):
+        ...     print('row %s saved' % row)
+        ...
+        >>> row_saved.connect(on_row_saved)
+        >>> with row_saved.blocked():
+        ...     for row in range(3):
+        ...         row_saved.emit(row=row)
+        ...
+        row 2 saved
+        >>> with row_saved.blocked(coalesce=False):
+        ...     for row in range(2):
+        ...         row_saved.emit(row=row)
+        ...
+        row 0 saved
+        row 1 saved
+
+        If the context exits with an exception, recorded emits are
+        discarded. Nested contexts replay when the outermost one exits,
+        they raise ValueError if their ``coalesce`` differs from that of
+        the outermost context.
+
+        Blocking is not per thread: while the signal is blocked, emits from
+        every thread are recorded, and the thread exiting the outermost
+        context replays them.
+        """
+        with self._slots_lk:
+            recorder = self._recorder
+            if recorder is None:
+                recorder = self._recorder = _Recorder(coalesce)
+                self._upstream_changed()
+                outer = True
+            else:
+                _check_coalesce(recorder, coalesce)
+                outer = False
+
+        if not outer:
+            yield
+            return
+
+        try:
+            yield
+        except BaseException:
+            self._recorder = None
+            self._upstream_changed()
+            raise
+
+        self._recorder = None
+        self._upstream_changed()
+        recorder.flush()
+
+    def emit_batch(self, **columns):
+        """
+        Emit this signal once for each row of ``columns``, which must be
+        sequences of the same length, such as NumPy arrays.
+
+        Slots connected with the ``BATCH`` convention are called once with
+        the whole columns, before the other slots are called for every row,
+        ie.:
+
+        >>> sampled = Signal(args=['value'])
+        >>> def total(value, **kwargs):
+        ...     print('total %s' % sum(value))
+        ...
+        >>> def show(value, **kwargs):
+        ...     print('value %s' % value)
+        ...
+        >>> sampled.connect(total, convention=BATCH)
+        >>> sampled.connect(show)
+        >>> sampled.emit_batch(value=[1, 2, 3])
+        total 6
+        value 1
+        value 2
+        value 3
+
+        Results of slots are ignored, but a slot returning anything other
+        than None still prevents the following slots from being called for
+        that row. While the signal is blocked, every row is recorded as an
+        emit. Cached results are neither used nor stored.
+        """
+        lengths = set(len(column) for column in columns.values())
+        if len(lengths) > 1:
+            raise ValueError('Columns must have the same length, got %s' % (
+                sorted(lengths),))
+
+        names = list(columns)
+        rows = (dict(zip(names, values))
+                for values in zip(*[columns[name] for name in names]))
+
+        recorder = self._recorder or _recorder
+        if recorder is not None:
+            for row in rows:
+                recorder.record(self, row)
+            return
+
+        slots, ranked, index, mortal = self._get_dispatch()
+        for convention, slot in slots:
+            if convention == BATCH:
+                slot(**columns)
+
+        if index or any(convention != BATCH for convention, slot in slots):
+            for row in rows:
+                self._emit(row, batch=True)
+
+    def _emit(self, kwargs, batch=False, profiler=None):
+        """
+        Call the slots selected for ``kwargs`` until one returns a result.
+
+        If ``batch`` is true, ``kwargs`` is a row of :py:meth:`emit_batch`
+        and slots of the ``BATCH`` convention are skipped. If ``profiler``
+        is set, the emit and every slot call are timed.
+        """
+        if profiler is not None:
+            emit_wall = time.perf_counter()
+            emit_cpu = _cpu_time()
+
+        result = mapping = names = None
+        for convention, slot in self._select(kwargs):
+            if profiler is not None:
+                wall = time.perf_counter()
+                cpu = _cpu_time()
+
+            if convention == KWARGS:
+                result = slot(**kwargs)
+            elif convention == MAPPING:
+                if mapping is None:
+                    mapping = types.MappingProxyType(kwargs)
+                result = slot(mapping)
+            elif convention == BATCH:
+                if batch:
+                    continue
+                result = slot(**dict((key, [value])
+                                     for key, value in kwargs.items()))
+            else:
+                if convention is not names:
+                    names = convention
+                    args = tuple(kwargs.get(name) for name in names)
+                result = slot(*args)
+
+            if profiler is not None:
+                profiler.record_slot(self, slot, time.perf_counter() - wall,
+                                     _cpu_time() - cpu)
+
+            if result is not None:
+                break
+
+        if profiler is not None:
+            profiler.record_emit(self, time.perf_counter() - emit_wall,
+                                 _cpu_time() - emit_cpu)
+        return result
+
     def __eq__(self, other):
         """
         Return True if other has the same slots connected.
@@ -41,13 +41,13 @@ class Slot(BaseSlot):
         else:
             return self._slot
 
-    def __call__(self, **kwargs):
+    def __call__(self, *args, **kwargs):
         """
         Execute this slot.
         """
         func = self.func
         if func is not None:
-            return func(**kwargs)
+            return func(*args, **kwargs)
 
     def __eq__(self, other):
         """
@@ -0,0 +1,203 @@
+"""
+Stress harness for thread safe signals.
+
+:py:func:`run` builds a random topology of ``Signal(threadsafe=True)``
+objects, some forwarding to others, with permanent slots connected to each
+of them. Then threads concurrently emit, connect and disconnect slots, and
+connect weak slots whose referent is dropped right away. When time is up,
+it checks that:
+
+- no thread raised an exception,
+- no slot was called twice for the same emit,
+- every permanent slot was called once for every emit that reaches it.
+
+It returns a report with the number of operations and emits per second,
+so that changes to :py:class:`~signalslot.signal.Signal` can be checked
+for correctness and throughput, ie.::
+
+    python -m signalslot.stress --threads 8 --duration 5
+"""
+
+import argparse
+import collections
+import json
+import random
+import threading
+import time
+
+from .signal import Signal
+from .slot import Slot
+
+
+class _Probe(object):
+    """
+    Slot recording the emit tokens it receives.
+    """
+    def __init__(self):
+        self.calls = 0
+        self.doubles = 0
+        self.tokens = set()
+        self.lock = threading.Lock()
+
+    def __call__(self, token, **kwargs):
+        with self.lock:
+            self.calls += 1
+            if token in self.tokens:
+                self.doubles += 1
+            self.tokens.add(token)
+
+
+class _Referent(object):
+    """
+    Object whose method is connected as a weak slot.
+    """
+    def __init__(self):
+        self.probe = _Probe()
+
+    def slot(self, **kwargs):
+        self.probe(**kwargs)
+
+
+def topology(rng, signals, slots):
+    """
+    Return ``signals`` new signals and the index of the signals each of
+    them forwards to, with ``slots`` permanent slots spread on them.
+
+    Forwarding forms a forest, so that no slot is reached twice by an emit.
+    """
+    nodes = [Signal(name='stress-%s' % i, threadsafe=True)
+             for i in range(signals)]
+    forwards = collections.defaultdict(list)
+    has_upstream = set()
+    for i in range(signals):
+        for j in range(i + 1, signals):
+            if j not in has_upstream and rng.random() < 1.0 / signals:
+                nodes[i].forward_to(nodes[j])
+                forwards[i].append(j)
+                has_upstream.add(j)
+
+    permanent = []
+    for k in range(slots):
+        i = rng.randrange(signals)
+        probe = _Probe()
+        nodes[i].connect(probe)
+        permanent.append((i, probe))
+    return nodes, forwards, permanent
+
+
+def _reach(forwards, i):
+    """
+    Return the indexes of the signals reached by an emit of signal ``i``.
+    """
+    reached = [i]
+    for j in forwards.get(i, ()):
+        reached.extend(_reach(forwards, j))
+    return reached
+
+
+def run(threads=8, duration=1.0, signals=8, slots=64, seed=None):
+    """
+    Run the stress test and return its report as a dict, ``ok`` is True if
+    every invariant held.
+    """
+    seed = random.randrange(2 ** 32) if seed is None else seed
+    rng = random.Random(seed)
+    nodes, forwards, permanent = topology(rng, signals, slots)
+
+    emits = [0] * signals
+    counts = collections.Counter()
+    errors = []
+    churned = []
+    lock = threading.Lock()
+    deadline = time.time() + duration
+
+    def worker(n):
+        rng = random.Random(seed + n + 1)
+        local_emits = [0] * signals
+        local = collections.Counter()
+        mine = []
+        try:
+            while time.time() < deadline:
+                i = rng.randrange(signals)
+                action = rng.random()
+                if action < 0.7:
+                    nodes[i].emit(token=(n, local['emit']))
+                    local_emits[i] += 1
+                    local['emit'] += 1
+                elif action < 0.8:
+                    probe = _Probe()
+                    nodes[i].connect(probe)
+                    mine.append((i, probe))
+                    local['connect'] += 1
+                elif action < 0.9:
+                    if mine:
+                        j, probe = mine.pop(rng.randrange(len(mine)))
+                        nodes[j].disconnect(probe)
+                        local['disconnect'] += 1
+                else:
+                    referent = _Referent()
+                    nodes[i].connect(Slot(referent.slot, weak=True))
+                    churned.append(referent.probe)
+                    referent = None
+                    local['weak_drop'] += 1
+        except Exception as e:
+            errors.append(repr(e))
+        with lock:
+            for i, count in enumerate(local_emits):
+                emits[i] += count
+            counts.update(local)
+            churned.extend(probe for j, probe in mine)
+
+    workers = [threading.Thread(target=worker, args=(n,))
+               for n in range(threads)]
+    started = time.time()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.time() - started
+
+    reaching = collections.Counter()
+    for i in range(signals):
+        for j in _reach(forwards, i):
+            reaching[j] += emits[i]
+    lost = sum(1 for i, probe in permanent
+               if probe.calls != reaching[i])
+    doubles = sum(probe.doubles
+                  for i, probe in permanent) + \
+        sum(probe.doubles for probe in churned)
+
+    return {
+        'seed': seed,
+        'threads': threads,
+        'signals': signals,
+        'forwards': sum(len(targets) for targets in forwards.values()),
+        'slots': slots,
+        'elapsed': elapsed,
+        'operations': dict(counts),
+        'emits_per_second': counts['emit'] / elapsed if elapsed else 0,
+        'errors': errors,
+        'lost': lost,
+        'doubles': doubles,
+        'ok': not errors and not lost and not doubles,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Stress test thread safe signals.')
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=1.0)
+    parser.add_argument('--signals', type=int, default=8)
+    parser.add_argument('--slots', type=int, default=64)
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args(argv)
+
+    report = run(args.threads, args.duration, args.signals, args.slots,
+                 args.seed)
+    print(json.dumps(report, indent=1, sort_keys=True))
+    return 0 if report['ok'] else 1
+
+
+if __name__ == '__main__':  # pragma: no cover
+    raise SystemExit(main())
@@ -1,7 +1,32 @@
 import pytest
 import mock
 
-from signalslot import Signal, SlotMustAcceptKeywords, Slot
+from signalslot import Signal, SlotMustAcceptKeywords, Slot, EmitCache
+from signalslot import disconnect_owner, CircuitBreaker, blocked_signals
+from signalslot import MAPPING, ARGS, BATCH, ForwardingCycle
+from signalslot import SlotNotImportable, WiringMismatch, SlotOptionNotSaved
+from signalslot.wiring import dump_wiring, load_wiring
+from signalslot import introspect, stress, profile, Channel
+from signalslot import channel, benchmark, FREE_THREADED
+from signalslot.signal import DummyLock
+import threading
+import time
+import io
+import json
+import random
+from signalslot.signal import _owned, _owner_finalizers
+
+
+def wired_slot(**kwargs):
+    return 'wired'
+
+
+def other_wired_slot(**kwargs):
+    pass
+
+
+def args_wired_slot(tenant_id):
+    return 'args %s' % tenant_id
 
 
 @mock.patch('signalslot.signal.inspect')
@@ -96,6 +121,270 @@ class TestSignalConnect(object):
             self.signal.connect(cb)
 
 
+class TestSignalMatch(object):
+    def setup_method(self, method):
+        self.signal = Signal(args=['tenant_id'])
+        self.calls = []
+
+    def slot(self, label):
+        def slot(**kwargs):
+            self.calls.append(label)
+        return slot
+
+    def test_only_matching_slots_are_called(self):
+        self.signal.connect(self.slot('a'), match={'tenant_id': 1})
+        self.signal.connect(self.slot('b'), match={'tenant_id': 2})
+        self.signal.connect(self.slot('all'))
+
+        self.signal.emit(tenant_id=2)
+
+        assert self.calls == ['b', 'all']
+
+    def test_connection_order_is_kept(self):
+        self.signal.connect(self.slot('a'))
+        self.signal.connect(self.slot('b'), match={'tenant_id': 1})
+        self.signal.connect(self.slot('c'))
+        self.signal.connect(self.slot('d'), match={'tenant_id': 1, 'x': 2})
+        self.signal.connect(self.slot('e'), match={'tenant_id': 1})
+
+        self.signal.emit(tenant_id=1, x=2)
+
+        assert self.calls == ['a', 'b', 'c', 'd', 'e']
+
+    def test_missing_or_unhashable_kwarg_does_not_match(self):
+        self.signal.connect(self.slot('a'), match={'tenant_id': 1})
+
+        self.signal.emit()
+        self.signal.emit(tenant_id=[1])
+
+        assert self.calls == []
+
+    def test_unhashable_match_is_rejected(self):
+        with pytest.raises(TypeError):
+            self.signal.connect(self.slot('a'), match={'tags': [1]})
+        self.signal.connect(self.slot('b'))
+
+        self.signal.emit(x=1)
+
+        assert self.calls == ['b']
+
+    def test_disconnect_removes_from_index(self):
+        slot = self.slot('a')
+        self.signal.connect(slot, match={'tenant_id': 1})
+        self.signal.disconnect(slot)
+
+        self.signal.emit(tenant_id=1)
+
+        assert self.calls == []
+        assert self.signal._filters == {}
+
+    def test_weak_slot_cleanup_removes_filter(self):
+        class Receiver(object):
+            def slot(self, **kwargs):
+                pass
+
+        receiver = Receiver()
+        self.signal.connect(Slot(receiver.slot, weak=True),
+                            match={'tenant_id': 1})
+        receiver = None
+
+        assert self.signal.slots == []
+        assert self.signal._filters == {}
+
+
+class TestEmitCache(object):
+    def setup_method(self, method):
+        self.now = 0
+        self.cache = EmitCache(maxsize=2, ttl=10, timer=lambda: self.now)
+        self.signal = Signal(cache=self.cache)
+        self.calls = []
+
+        def slot(**kwargs):
+            self.calls.append(kwargs)
+            return kwargs.get('x')
+
+        self.slot = slot
+        self.signal.connect(self.slot)
+
+    def test_hit(self):
+        assert self.signal.emit(x=1) == 1
+        assert self.signal.emit(x=1) == 1
+
+        assert len(self.calls) == 1
+        assert (self.cache.hits, self.cache.misses) == (1, 1)
+
+    def test_none_result_is_cached(self):
+        self.signal.emit()
+        self.signal.emit()
+
+        assert len(self.calls) == 1
+
+    def test_unhashable_kwargs_are_not_cached(self):
+        self.signal.emit(x=[])
+        self.signal.emit(x=[])
+
+        assert len(self.calls) == 2
+        assert (self.cache.hits, self.cache.misses) == (0, 0)
+
+    def test_lru_eviction(self):
+        self.signal.emit(x=1)
+        self.signal.emit(x=2)
+        self.signal.emit(x=1)
+        self.signal.emit(x=3)
+        self.signal.emit(x=1)
+        self.signal.emit(x=2)
+
+        assert len(self.calls) == 4
+        assert len(self.cache) == 2
+
+    def test_ttl(self):
+        self.signal.emit(x=1)
+        self.now = 10
+        self.signal.emit(x=1)
+
+        assert len(self.calls) == 2
+
+    def test_connect_invalidates(self):
+        self.signal.emit(x=1)
+        self.signal.connect(lambda **kwargs: 'other')
+
+        assert self.signal.emit(x=1) == 1
+        assert len(self.calls) == 2
+
+    def test_disconnect_invalidates(self):
+        self.signal.emit(x=1)
+        self.signal.disconnect(self.slot)
+
+        assert self.signal.emit(x=1) is None
+        assert len(self.calls) == 1
+
+    def test_dead_weak_slot_invalidates(self):
+        class Referent(object):
+            def slot(self, **kwargs):
+                return 'from-dead-object'
+
+        referent = Referent()
+        self.signal.disconnect(self.slot)
+        self.signal.connect(Slot(referent.slot, weak=True))
+        assert self.signal.emit(x=1) == 'from-dead-object'
+
+        referent = None
+
+        assert self.signal.emit(x=1) is None
+        assert self.signal.slots == []
+
+    def test_change_during_emit_is_not_cached(self):
+        def connecting(**kwargs):
+            self.signal.connect(lambda **kwargs: 'other')
+            return 'stale'
+
+        self.signal.disconnect(self.slot)
+        self.signal.connect(connecting)
+        assert self.signal.emit(x=1) == 'stale'
+
+        assert len(self.cache) == 0
+        assert self.signal.emit(x=1) == 'stale'
+        assert self.cache.misses == 2
+
+
+class TestOwner(object):
+    def setup_method(self, method):
+        self.signal_a = Signal()
+        self.signal_b = Signal()
+
+        class Owner(object):
+            def slot(self, **kwargs):
+                pass
+
+        self.owner = Owner()
+        self.other = Owner()
+
+    def test_disconnect_owner(self):
+        self.signal_a.connect(self.owner.slot, owner=self.owner)
+        self.signal_b.connect(self.owner.slot, owner=self.owner)
+        self.signal_b.connect(self.other.slot, owner=self.other)
+
+        disconnect_owner(self.owner)
+
+        assert self.signal_a.slots == []
+        assert self.signal_b.slots == [self.other.slot]
+        assert id(self.owner) not in _owned
+
+    def test_disconnect_owner_without_connections(self):
+        disconnect_owner(self.owner)
+
+    def test_disconnect_forgets_owner(self):
+        self.signal_a.connect(self.owner.slot, owner=self.owner)
+        self.signal_a.disconnect(self.owner.slot)
+
+        assert id(self.owner) not in _owned
+
+    def test_owner_record_dropped_on_gc(self):
+        self.signal_a.connect(Slot(self.owner.slot, weak=True),
+                              owner=self.owner)
+        key = id(self.owner)
+        self.owner = None
+
+        assert key not in _owned
+        assert self.signal_a.slots == []
+
+    def test_reconnect_does_not_leak_finalizers(self):
+        finalizers = []
+        for i in range(3):
+            self.signal_a.connect(self.owner.slot, owner=self.owner)
+            finalizers.append(_owner_finalizers[id(self.owner)])
+            disconnect_owner(self.owner)
+            self.signal_a.connect(self.other.slot, owner=self.other)
+            finalizers.append(_owner_finalizers[id(self.other)])
+            self.signal_a.disconnect(self.other.slot)
+
+        assert not any(finalizer.alive for finalizer in finalizers)
+        assert id(self.owner) not in _owner_finalizers
+        assert id(self.other) not in _owner_finalizers
+
+    def test_owner_without_weak_references(self):
+        with pytest.raises(TypeError):
+            self.signal_a.connect(self.owner.slot, owner=42)
+
+        assert not self.signal_a.is_connected(self.owner.slot)
+        assert id(42) not in _owned
+
+        self.signal_a.connect(self.owner.slot)
+        assert self.signal_a.slots == [self.owner.slot]
+
+
+class TestConnectMany(object):
+    def setup_method(self, method):
+        self.signal = Signal(threadsafe=True)
+        self.calls = []
+
+        def make_slot(label):
+            def slot(**kwargs):
+                self.calls.append(label)
+            return slot
+
+        self.slots = [make_slot(label) for label in range(5)]
+
+    def test_connect_many(self):
+        self.signal.connect_many(self.slots + self.slots[:1])
+        self.signal.emit()
+
+        assert self.calls == list(range(5))
+
+    def test_connect_many_checks_every_slot_first(self):
+        with pytest.raises(SlotMustAcceptKeywords):
+            self.signal.connect_many(self.slots + [lambda: None])
+
+        assert self.signal.slots == []
+
+    def test_disconnect_many(self):
+        self.signal.connect_many(self.slots)
+        self.signal.disconnect_many(self.slots[1:4])
+        self.signal.emit()
+
+        assert self.calls == [0, 4]
+
+
 class MyTestError(Exception):
     pass
 
@@ -203,3 +492,1107 @@ class TestSlotEq(object):
 
     def test_eq_func(self):
         assert self.slot_a == self.slot
+
+
+class TestCircuitBreaker(object):
+    def setup_method(self, method):
+        self.now = 0
+        self.signal = Signal()
+        self.calls = []
+        self.fail = True
+
+        def slot(**kwargs):
+            self.calls.append('slot')
+            self.now += kwargs.get('duration', 0)
+            if self.fail:
+                raise MyTestError('die!')
+            return kwargs.get('result')
+
+        def after(**kwargs):
+            self.calls.append('after')
+
+        self.slot = slot
+        self.after = after
+
+    def breaker(self, **kwargs):
+        return CircuitBreaker(timer=lambda: self.now, **kwargs)
+
+    def test_isolate_runs_later_slots(self):
+        breaker = self.breaker(isolate=True)
+        self.signal.connect(self.slot, breaker=breaker)
+        self.signal.connect(self.after)
+
+        self.signal.emit()
+
+        assert self.calls == ['slot', 'after']
+        assert isinstance(breaker.last_exception, MyTestError)
+
+    def test_exception_propagates_without_isolate(self):
+        self.signal.connect(self.slot, breaker=self.breaker())
+
+        with pytest.raises(MyTestError):
+            self.signal.emit()
+
+    def test_opens_after_consecutive_failures(self):
+        breaker = self.breaker(max_failures=2, cooldown=10, isolate=True)
+        self.signal.connect(self.slot, breaker=breaker)
+
+        for i in range(4):
+            self.signal.emit()
+
+        assert self.calls == ['slot', 'slot']
+        assert breaker.is_open
+        assert breaker.skipped == 2
+
+    def test_half_open_probe_failure_reopens(self):
+        breaker = self.breaker(max_failures=1, cooldown=10, isolate=True)
+        self.signal.connect(self.slot, breaker=breaker)
+        self.signal.emit()
+
+        self.now = 10
+        self.signal.emit()
+        self.signal.emit()
+
+        assert self.calls == ['slot', 'slot']
+        assert breaker.opened_at == 10
+
+    def test_half_open_probe_success_closes(self):
+        breaker = self.breaker(max_failures=1, cooldown=10, isolate=True)
+        self.signal.connect(self.slot, breaker=breaker)
+        self.signal.emit()
+
+        self.now = 10
+        self.fail = False
+        assert self.signal.emit(result=1) == 1
+        assert self.signal.emit(result=2) == 2
+        assert not breaker.is_open
+        assert breaker.failures == 0
+
+    def test_interrupted_probe_reopens(self):
+        breaker = self.breaker(max_failures=1, cooldown=10, isolate=True)
+        self.signal.connect(self.slot, breaker=breaker)
+        self.signal.emit()
+
+        def interrupted(**kwargs):
+            raise KeyboardInterrupt()
+
+        breaker.slot = interrupted
+        self.now = 10
+        with pytest.raises(KeyboardInterrupt):
+            self.signal.emit()
+
+        assert not breaker.probing
+        assert breaker.is_open
+        self.now = 20
+        breaker.slot = self.slot
+        self.fail = False
+        assert self.signal.emit(result=1) == 1
+        assert not breaker.is_open
+
+    def test_latency_budget(self):
+        self.fail = False
+        breaker = self.breaker(max_failures=2, latency=1, cooldown=10)
+        self.signal.connect(self.slot, breaker=breaker)
+
+        self.signal.emit(duration=2)
+        self.signal.emit(duration=0.5)
+        self.signal.emit(duration=2)
+        self.signal.emit(duration=2)
+        self.signal.emit(duration=2)
+
+        assert len(self.calls) == 4
+        assert breaker.is_open
+
+    def test_one_probe_at_a_time(self):
+        breaker = self.breaker(max_failures=1, cooldown=10, isolate=True)
+        self.signal.connect(self.slot, breaker=breaker)
+        self.signal.emit()
+        probing = threading.Event()
+        release = threading.Event()
+
+        def blocking(**kwargs):
+            probing.set()
+            release.wait(1)
+            return 'probed'
+
+        breaker.slot = blocking
+        self.now = 10
+        results = []
+        prober = threading.Thread(
+            target=lambda: results.append(breaker()))
+        prober.start()
+        probing.wait(1)
+
+        assert breaker() is None
+        assert breaker.skipped == 1
+        release.set()
+        prober.join(1)
+        assert results == ['probed']
+        assert not breaker.is_open
+
+    def test_shared_breaker_is_rejected(self):
+        breaker = self.breaker()
+        self.signal.connect(self.slot, breaker=breaker)
+        self.signal.connect(self.slot, breaker=breaker)
+
+        with pytest.raises(ValueError):
+            self.signal.connect(self.after, breaker=breaker)
+
+        assert breaker.slot is self.slot
+        assert not self.signal.is_connected(self.after)
+
+    def test_disconnect_forgets_breaker(self):
+        self.signal.connect(self.slot, breaker=self.breaker())
+        self.signal.disconnect(self.slot)
+
+        assert self.signal._breakers == {}
+
+
+class TestBlocked(object):
+    def setup_method(self, method):
+        self.signal_a = Signal()
+        self.signal_b = Signal()
+        self.calls = []
+
+        def slot_a(**kwargs):
+            self.calls.append(('a', kwargs))
+
+        def slot_b(**kwargs):
+            self.calls.append(('b', kwargs))
+
+        self.signal_a.connect(slot_a)
+        self.signal_b.connect(slot_b)
+
+    def test_blocked_returns_none(self):
+        self.signal_a.connect(lambda **kwargs: 'result')
+
+        with self.signal_a.blocked():
+            assert self.signal_a.emit(x=1) is None
+            assert self.calls == []
+
+    def test_blocked_only_blocks_its_signal(self):
+        with self.signal_a.blocked():
+            self.signal_a.emit(x=1)
+            self.signal_b.emit(x=2)
+            assert self.calls == [('b', {'x': 2})]
+
+        assert self.calls == [('b', {'x': 2}), ('a', {'x': 1})]
+
+    def test_nested_flushes_on_outer_exit(self):
+        with self.signal_a.blocked():
+            with self.signal_a.blocked():
+                self.signal_a.emit(x=1)
+            assert self.calls == []
+
+        assert self.calls == [('a', {'x': 1})]
+
+    def test_exception_discards(self):
+        with pytest.raises(MyTestError):
+            with self.signal_a.blocked():
+                self.signal_a.emit(x=1)
+                raise MyTestError()
+
+        self.signal_a.emit(x=2)
+        assert self.calls == [('a', {'x': 2})]
+
+    def test_blocked_signals_coalesce(self):
+        with blocked_signals():
+            self.signal_a.emit(x=1)
+            self.signal_b.emit(x=2)
+            self.signal_a.emit(x=3)
+
+        assert self.calls == [('b', {'x': 2}), ('a', {'x': 3})]
+
+    def test_blocked_signals_all_in_order(self):
+        with blocked_signals(coalesce=False):
+            self.signal_a.emit(x=1)
+            self.signal_b.emit(x=2)
+            self.signal_a.emit(x=3)
+
+        assert self.calls == [
+            ('a', {'x': 1}), ('b', {'x': 2}), ('a', {'x': 3})]
+
+    def test_nested_coalesce_conflict(self):
+        with self.signal_a.blocked():
+            with pytest.raises(ValueError):
+                with self.signal_a.blocked(coalesce=False):
+                    pass
+            with self.signal_a.blocked(coalesce=True):
+                self.signal_a.emit(x=1)
+
+        with blocked_signals(coalesce=False):
+            with pytest.raises(ValueError):
+                with blocked_signals():
+                    pass
+
+        assert self.calls == [('a', {'x': 1})]
+
+    def test_signal_blocked_inside_blocked_signals(self):
+        with self.signal_a.blocked():
+            with blocked_signals():
+                self.signal_a.emit(x=1)
+                self.signal_b.emit(x=2)
+            assert self.calls == [('b', {'x': 2})]
+
+        assert self.calls == [('b', {'x': 2}), ('a', {'x': 1})]
+
+
+class TestCallLimit(object):
+    def setup_method(self, method):
+        self.signal = Signal(threadsafe=True)
+        self.calls = []
+
+        def slot(**kwargs):
+            self.calls.append('slot')
+
+        def other(**kwargs):
+            self.calls.append('other')
+
+        self.slot = slot
+        self.other = other
+
+    def test_once(self):
+        self.signal.connect(self.slot, once=True)
+        self.signal.connect(self.other)
+
+        self.signal.emit()
+        self.signal.emit()
+
+        assert self.calls == ['slot', 'other', 'other']
+        assert not self.signal.is_connected(self.slot)
+        assert self.signal._limits == {}
+
+    def test_max_calls(self):
+        self.signal.connect(self.slot, max_calls=2)
+
+        for i in range(3):
+            self.signal.emit()
+
+        assert self.calls == ['slot', 'slot']
+
+    @pytest.mark.parametrize('max_calls', [0, -1])
+    def test_invalid_max_calls(self, max_calls):
+        with pytest.raises(ValueError):
+            self.signal.connect(self.slot, max_calls=max_calls)
+        with pytest.raises(ValueError):
+            self.signal.connect_many([self.slot], max_calls=max_calls)
+
+        assert self.signal.slots == []
+
+    def test_once_and_max_calls(self):
+        with pytest.raises(ValueError):
+            self.signal.connect(self.slot, once=True, max_calls=2)
+
+        assert self.signal.slots == []
+
+    def test_removal_during_emit_keeps_loop(self):
+        def reentrant(**kwargs):
+            self.calls.append('reentrant')
+            if kwargs.get('again'):
+                self.signal.emit()
+
+        self.signal.connect(reentrant, once=True)
+        self.signal.connect(self.slot, once=True)
+        self.signal.connect(self.other)
+
+        self.signal.emit(again=True)
+
+        assert self.calls == ['reentrant', 'slot', 'other', 'other']
+
+    def test_stale_snapshot_does_not_call_again(self):
+        self.signal.connect(self.slot, once=True)
+        dispatch = self.signal._get_dispatch()
+
+        self.signal.emit()
+        for convention, slot in dispatch[0]:
+            slot()
+
+        assert self.calls == ['slot']
+
+    def test_once_with_breaker(self):
+        breaker = CircuitBreaker(isolate=True)
+        self.signal.connect(self.slot, breaker=breaker, once=True)
+
+        self.signal.emit()
+        self.signal.emit()
+
+        assert self.calls == ['slot']
+
+    def test_connect_many_once(self):
+        self.signal.connect_many([self.slot, self.other], once=True)
+
+        self.signal.emit()
+        self.signal.emit()
+
+        assert self.calls == ['slot', 'other']
+
+
+class TestConvention(object):
+    def setup_method(self, method):
+        self.signal = Signal(args=['x', 'y'])
+        self.received = []
+
+    def test_mapping_is_shared_and_read_only(self):
+        def slot(event):
+            self.received.append(event)
+
+        def other(event):
+            self.received.append(event)
+
+        self.signal.connect(slot, convention=MAPPING)
+        self.signal.connect(other, convention=MAPPING)
+        self.signal.emit(x=1)
+
+        first, second = self.received
+        assert first is second
+        assert dict(first) == {'x': 1}
+        with pytest.raises(TypeError):
+            first['x'] = 2
+
+    def test_args_in_signal_order(self):
+        def slot(x, y):
+            self.received.append((x, y))
+
+        self.signal.connect(slot, convention=ARGS)
+        self.signal.emit(y=2, x=1, z=3)
+        self.signal.emit(x=1)
+
+        assert self.received == [(1, 2), (1, None)]
+
+    def test_args_are_shared(self):
+        def slot(*args):
+            self.received.append(args)
+
+        def other(*args):
+            self.received.append(args)
+
+        self.signal.connect(slot, convention=ARGS)
+        self.signal.connect(other, convention=ARGS)
+        self.signal.emit(x=1, y=2)
+
+        assert self.received == [(1, 2), (1, 2)]
+        first, second = [convention for convention, slot
+                         in self.signal._get_dispatch()[0]]
+        assert first is second
+
+    def test_mixed_conventions(self):
+        def kwargs_slot(**kwargs):
+            self.received.append(kwargs)
+
+        def args_slot(x, y):
+            self.received.append((x, y))
+
+        self.signal.connect(kwargs_slot)
+        self.signal.connect(args_slot, convention=ARGS)
+        self.signal.emit(x=1, y=2)
+
+        assert self.received == [{'x': 1, 'y': 2}, (1, 2)]
+
+    def test_weak_slot_with_mapping(self):
+        class Receiver(object):
+            def __init__(self, test):
+                self.test = test
+
+            def slot(self, event):
+                self.test.received.append(dict(event))
+
+        receiver = Receiver(self)
+        self.signal.connect(Slot(receiver.slot, weak=True),
+                            convention=MAPPING)
+        self.signal.emit(x=1)
+
+        assert self.received == [{'x': 1}]
+
+    def test_wrapped_slot_with_args(self):
+        def slot(x, y):
+            self.received.append((x, y))
+
+        self.signal.connect(slot, convention=ARGS, once=True,
+                            breaker=CircuitBreaker())
+        self.signal.emit(x=1, y=2)
+        self.signal.emit(x=1, y=2)
+
+        assert self.received == [(1, 2)]
+
+    def test_unknown_convention(self):
+        with pytest.raises(ValueError):
+            self.signal.connect(lambda **kwargs: None, convention='foo')
+
+
+class TestForwardTo(object):
+    def setup_method(self, method):
+        self.a = Signal(name='a')
+        self.b = Signal(name='b', args=['y', 'x'])
+        self.c = Signal(name='c')
+        self.calls = []
+
+    def slot(self, label, result=None):
+        def slot(**kwargs):
+            self.calls.append(label)
+            return result
+        return slot
+
+    def test_chain_is_flattened(self):
+        self.a.connect(self.slot('a'))
+        self.b.connect(self.slot('b'))
+        self.c.connect(self.slot('c'))
+        self.a.forward_to(self.b)
+        self.b.forward_to(self.c)
+
+        self.a.emit()
+
+        assert self.calls == ['a', 'b', 'c']
+        slots = [slot for convention, slot in self.a._get_dispatch()[0]]
+        assert self.b.emit not in slots
+        assert self.c.emit not in slots
+
+    def test_result_stops_chain(self):
+        self.b.connect(self.slot('b', 'result'))
+        self.c.connect(self.slot('c'))
+        self.a.forward_to(self.b)
+        self.a.forward_to(self.c)
+
+        assert self.a.emit() == 'result'
+        assert self.calls == ['b']
+
+    def test_change_downstream_reflattens(self):
+        self.a.forward_to(self.b)
+        self.b.forward_to(self.c)
+        self.a.emit()
+
+        slot = self.slot('c')
+        self.c.connect(slot)
+        self.a.emit()
+        self.c.disconnect(slot)
+        self.a.emit()
+
+        assert self.calls == ['c']
+
+    def test_stop_forwarding_to(self):
+        self.b.connect(self.slot('b'))
+        self.a.forward_to(self.b)
+        self.a.emit()
+        self.a.stop_forwarding_to(self.b)
+        self.a.emit()
+
+        assert self.calls == ['b']
+        assert self.b._upstream == {}
+
+    def test_change_while_flattening_is_not_kept(self):
+        self.a.forward_to(self.b)
+        entries = self.b._entries
+        slot = self.slot('b')
+
+        def changing():
+            # As if another thread connected a slot to b right now.
+            self.b._entries = entries
+            result = entries()
+            self.b.connect(slot)
+            return result
+
+        self.b._entries = changing
+        self.a.emit()
+        self.a.emit()
+
+        assert self.calls == ['b']
+
+    def test_cycle(self):
+        self.a.forward_to(self.b)
+        self.b.forward_to(self.c)
+
+        with pytest.raises(ForwardingCycle):
+            self.c.forward_to(self.a)
+        with pytest.raises(ForwardingCycle):
+            self.a.forward_to(self.a)
+
+    def test_concurrent_cycle(self):
+        for i in range(50):
+            a, b = Signal(threadsafe=True), Signal(threadsafe=True)
+            barrier = threading.Barrier(2)
+
+            def forward(signal, other):
+                barrier.wait()
+                try:
+                    signal.forward_to(other)
+                except ForwardingCycle:
+                    pass
+
+            threads = [threading.Thread(target=forward, args=(a, b)),
+                       threading.Thread(target=forward, args=(b, a))]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert not (a._forwards_to(b) and b._forwards_to(a))
+
+    def test_dead_upstream_is_forgotten(self):
+        self.a.forward_to(self.b)
+
+        self.a = None
+
+        assert self.b._upstream == {}
+
+    def test_forwarded_filters_and_args(self):
+        received = []
+
+        def args_slot(y, x):
+            received.append((y, x))
+
+        self.b.connect(self.slot('b1'), match={'x': 1})
+        self.b.connect(args_slot, convention=ARGS)
+        self.a.forward_to(self.b)
+
+        self.a.emit(x=1, y=2)
+        self.a.emit(x=2, y=2)
+
+        assert self.calls == ['b1']
+        assert received == [(2, 1), (2, 2)]
+
+    def test_blocked_target_is_not_flattened(self):
+        self.b.connect(self.slot('b'))
+        self.a.forward_to(self.b)
+
+        with self.b.blocked():
+            self.a.emit(x=1)
+            assert self.calls == []
+
+        assert self.calls == ['b']
+
+
+class TestWiring(object):
+    def setup_method(self, method):
+        self.signal_a = Signal(name='a')
+        self.signal_b = Signal(name='b')
+
+    def dump(self, *signals):
+        fp = io.StringIO()
+        dump_wiring(signals, fp)
+        fp.seek(0)
+        return fp
+
+    def test_round_trip(self):
+        self.signal_a.connect(other_wired_slot)
+        self.signal_a.connect(Slot(wired_slot, weak=True))
+        self.signal_b.connect(wired_slot)
+        fp = self.dump(self.signal_a, self.signal_b)
+
+        a, b = Signal(name='a'), Signal(name='b')
+        load_wiring([a, b], fp)
+
+        assert a.slots == [other_wired_slot, wired_slot]
+        assert a.slots[1]._weak
+        assert b.slots == [wired_slot]
+        assert a.emit() == 'wired'
+
+    def test_round_trip_options(self):
+        signal = Signal(name='a', args=['tenant_id'])
+        signal.connect(args_wired_slot, match={'tenant_id': 42},
+                       convention=ARGS)
+        signal.connect(wired_slot, max_calls=2)
+        signal.emit(tenant_id=1)
+        fp = self.dump(signal)
+
+        a = Signal(name='a', args=['tenant_id'])
+        load_wiring([a], fp)
+
+        assert a.emit(tenant_id=1) == 'wired'
+        assert a.emit(tenant_id=42) == 'args 42'
+        assert a.emit(tenant_id=1) is None
+
+    def test_owner_not_saved(self):
+        owner = Slot(other_wired_slot)
+        self.signal_a.connect(wired_slot, owner=owner)
+
+        with pytest.raises(SlotOptionNotSaved):
+            self.dump(self.signal_a)
+
+    def test_breaker_not_saved(self):
+        self.signal_a.connect(wired_slot, breaker=CircuitBreaker())
+
+        with pytest.raises(SlotOptionNotSaved):
+            self.dump(self.signal_a)
+
+    def test_load_into_connected_signal_does_not_duplicate(self):
+        self.signal_a.connect(wired_slot)
+        fp = self.dump(self.signal_a)
+
+        load_wiring([self.signal_a], fp)
+
+        assert self.signal_a.slots == [wired_slot]
+
+    def test_load_does_not_search_slots(self):
+        self.signal_a.connect(wired_slot)
+        self.signal_a.connect(Slot(other_wired_slot, weak=True))
+        fp = self.dump(self.signal_a)
+
+        for signal in (Signal(name='a'), self.signal_a):
+            fp.seek(0)
+            with mock.patch.object(signal, '_find') as find:
+                load_wiring([signal], fp)
+
+            assert find.call_count == 0
+            assert signal.slots == [wired_slot, other_wired_slot]
+
+    def test_not_importable(self):
+        self.signal_a.connect(lambda **kwargs: None)
+
+        with pytest.raises(SlotNotImportable):
+            self.dump(self.signal_a)
+
+    def test_unnamed_signal(self):
+        with pytest.raises(ValueError):
+            self.dump(Signal())
+
+    def test_code_changed(self):
+        self.signal_a.connect(wired_slot)
+        data = json.load(self.dump(self.signal_a))
+        data['signals']['a'][0]['hash'] = 'changed'
+
+        with pytest.raises(WiringMismatch):
+            load_wiring([self.signal_a], io.StringIO(json.dumps(data)))
+
+
+class TestEmitBatch(object):
+    def setup_method(self, method):
+        self.signal = Signal(args=['x', 'y'])
+        self.batches = []
+        self.rows = []
+
+        def batch_slot(**kwargs):
+            self.batches.append(kwargs)
+
+        def row_slot(**kwargs):
+            self.rows.append(kwargs)
+
+        self.batch_slot = batch_slot
+        self.row_slot = row_slot
+
+    def test_batch_and_row_slots(self):
+        self.signal.connect(self.batch_slot, convention=BATCH)
+        self.signal.connect(self.row_slot)
+
+        self.signal.emit_batch(x=[1, 2], y=(3, 4))
+
+        assert self.batches == [{'x': [1, 2], 'y': (3, 4)}]
+        assert self.rows == [{'x': 1, 'y': 3}, {'x': 2, 'y': 4}]
+
+    def test_batch_slot_on_emit(self):
+        self.signal.connect(self.batch_slot, convention=BATCH)
+
+        self.signal.emit(x=1)
+
+        assert self.batches == [{'x': [1]}]
+
+    def test_filtered_row_slots(self):
+        self.signal.connect(self.row_slot, match={'x': 2})
+
+        self.signal.emit_batch(x=[1, 2, 3])
+
+        assert self.rows == [{'x': 2}]
+
+    def test_length_mismatch(self):
+        with pytest.raises(ValueError):
+            self.signal.emit_batch(x=[1, 2], y=[1])
+
+    def test_batch_slot_cannot_be_filtered(self):
+        with pytest.raises(ValueError):
+            self.signal.connect(self.batch_slot, convention=BATCH,
+                                match={'x': 1})
+
+    def test_blocked_records_rows(self):
+        self.signal.connect(self.row_slot)
+
+        with self.signal.blocked(coalesce=False):
+            self.signal.emit_batch(x=[1, 2])
+
+        assert self.rows == [{'x': 1}, {'x': 2}]
+
+    def test_numpy_columns(self):
+        numpy = pytest.importorskip('numpy')
+        self.signal.connect(self.batch_slot, convention=BATCH)
+        self.signal.connect(self.row_slot)
+
+        self.signal.emit_batch(x=numpy.arange(3))
+
+        assert self.batches[0]['x'].sum() == 3
+        assert [row['x'] for row in self.rows] == [0, 1, 2]
+
+
+class TestIntrospect(object):
+    def setup_method(self, method):
+        class Receiver(object):
+            def __init__(self):
+                self.data = bytearray(10000)
+
+            def slot(self, **kwargs):
+                pass
+
+        self.receiver = Receiver()
+        self.weak_receiver = Receiver()
+        self.signal = Signal(name='introspected')
+        self.signal.connect(self.receiver.slot)
+        self.signal.connect(Slot(self.weak_receiver.slot, weak=True))
+
+    def test_live_signals(self):
+        assert self.signal in introspect.live_signals()
+
+        signal = Signal()
+        key = id(signal)
+        signal = None
+        assert key not in [id(s) for s in introspect.live_signals()]
+
+    def test_signal_report(self):
+        report = introspect.signal_report(self.signal)
+
+        assert report['name'] == 'introspected'
+        assert (report['slots'], report['strong'], report['weak'],
+                report['dead']) == (2, 1, 1, 0)
+        assert report['retained_bytes'] >= 10000
+
+    def test_dead_slots(self):
+        self.weak_receiver = None
+
+        report = introspect.signal_report(self.signal)
+
+        assert (report['weak'], report['dead']) == (0, 1)
+
+    def test_closure_size(self):
+        data = bytearray(20000)
+
+        def slot(**kwargs):
+            return data
+
+        signal = Signal()
+        signal.connect(slot)
+
+        assert introspect.signal_report(signal)['retained_bytes'] >= 20000
+
+    def test_report_is_sorted_and_serializable(self):
+        other = Signal(name='other')
+        report = introspect.wiring_report([other, self.signal])
+
+        assert [r['name'] for r in report] == ['introspected', 'other']
+        json.dumps(report)
+
+    def test_format_report(self):
+        text = introspect.format_report(
+            introspect.wiring_report([self.signal, Signal()]))
+        lines = text.splitlines()
+
+        assert lines[0].split() == ['name', 'slots', 'strong', 'weak',
+                                    'dead', 'forwards', 'retained_bytes']
+        assert lines[1].startswith('introspected')
+        assert lines[2].startswith('NO_NAME')
+
+
+class TestStress(object):
+    def test_threadsafe_signals(self):
+        report = stress.run(threads=4, duration=0.3, signals=4, slots=16,
+                            seed=1)
+
+        assert report['ok'], report
+        assert report['operations']['emit'] > 0
+
+    def test_topology_has_no_diamond(self):
+        nodes, forwards, permanent = stress.topology(
+            random.Random(2), signals=10, slots=10)
+        targets = [j for i in forwards for j in forwards[i]]
+
+        assert len(targets) == len(set(targets))
+        assert len(permanent) == 10
+
+
+def profiled_slot(**kwargs):
+    pass
+
+
+class TestProfile(object):
+    def setup_method(self, method):
+        self.profiler = profile.Profiler()
+        self.signal = Signal(name='profiled')
+        self.signal.connect(profiled_slot)
+        self.signal.connect(Slot(wired_slot), breaker=CircuitBreaker())
+
+    def test_sampling(self):
+        self.signal.profile(every=4, profiler=self.profiler)
+
+        for i in range(10):
+            self.signal.emit()
+
+        assert self.profiler.top_signals()[0]['calls'] == 2
+        assert [(s['slot'], s['calls'])
+                for s in self.profiler.top_slots(key='calls')] == [
+            ('signalslot.tests.profiled_slot', 2),
+            ('signalslot.tests.wired_slot', 2)]
+
+    def test_stop_profiling(self):
+        self.signal.profile(every=1, profiler=self.profiler)
+        self.signal.emit()
+        self.signal.profile(every=None)
+        self.signal.emit()
+
+        assert self.profiler.top_signals()[0]['calls'] == 1
+
+    def test_result_is_kept(self):
+        self.signal.profile(every=1, profiler=self.profiler)
+
+        assert self.signal.emit() == 'wired'
+
+    def test_sampling_is_per_thread(self):
+        self.signal.profile(every=2, profiler=self.profiler)
+
+        self.signal.emit()
+        thread = threading.Thread(target=self.signal.emit)
+        thread.start()
+        thread.join()
+
+        assert self.profiler.top_signals() == []
+        self.signal.emit()
+        assert self.profiler.top_signals()[0]['calls'] == 1
+
+    def test_forwarded_signal_is_sampled(self):
+        upstream = Signal(name='upstream')
+        upstream.emit()
+        upstream.forward_to(self.signal)
+        upstream.emit()
+        self.signal.profile(every=1, profiler=self.profiler)
+
+        upstream.emit()
+
+        assert [s['signal'] for s in self.profiler.top_signals()] == [
+            'profiled']
+
+    def test_forwarded_signal_is_counted(self):
+        upstream = Signal()
+        counted = Signal(stats=True)
+        counted.connect(profiled_slot)
+        upstream.forward_to(counted)
+
+        upstream.emit()
+
+        assert counted.emit_stats()['emits'] == 1
+
+    def test_default_profiler(self):
+        profile.default_profiler.clear()
+        self.signal.profile(every=1)
+        self.signal.emit()
+
+        assert profile.default_profiler.top_signals()[0]['signal'] == \
+            'profiled'
+        profile.default_profiler.clear()
+
+    def test_top_k(self):
+        self.signal.profile(every=1, profiler=self.profiler)
+        self.signal.emit()
+
+        assert len(self.profiler.top_slots(k=1)) == 1
+
+    def test_dump_and_report(self, tmpdir, capsys):
+        self.signal.profile(every=1, profiler=self.profiler)
+        self.signal.emit()
+        path = str(tmpdir.join('profile.json'))
+        with open(path, 'w') as fp:
+            self.profiler.dump(fp)
+
+        with open(path) as fp:
+            loaded = profile.Profiler.load(fp)
+        assert loaded.top_slots() == self.profiler.top_slots()
+
+        assert profile.main([path, '--top', '1']) == 0
+        out = capsys.readouterr()[0]
+        assert 'Slowest slots by mean_wall:' in out
+        assert 'profiled: signalslot.tests.' in out
+
+
+class TestChannel(object):
+    def setup_method(self, method):
+        self.signal = Signal()
+        self.received = []
+
+    def slot(self, **kwargs):
+        self.received.append(kwargs)
+
+    def test_queue_and_process(self):
+        chan = Channel(self.slot)
+        self.signal.connect(chan)
+
+        assert self.signal.emit(x=1) is None
+        assert self.received == []
+        assert chan.depth == 1
+
+        assert chan.process() == 1
+        assert self.received == [{'x': 1}]
+        assert chan.delivered == 1
+
+    def test_drop_newest(self):
+        chan = Channel(self.slot, maxsize=2, overflow=channel.DROP_NEWEST)
+        for x in range(4):
+            chan(x=x)
+
+        chan.process()
+
+        assert self.received == [{'x': 0}, {'x': 1}]
+        assert chan.dropped == 2
+        assert chan.max_depth == 2
+
+    def test_drop_oldest(self):
+        chan = Channel(self.slot, maxsize=2, overflow=channel.DROP_OLDEST)
+        for x in range(4):
+            chan(x=x)
+
+        chan.process()
+
+        assert self.received == [{'x': 2}, {'x': 3}]
+        assert chan.dropped == 2
+
+    def test_coalesce(self):
+        chan = Channel(self.slot, maxsize=2, overflow=channel.COALESCE,
+                       key=['id'])
+        chan(id=1, v=1)
+        chan(id=2, v=1)
+        chan(id=1, v=2)
+        chan(id=3, v=1)
+
+        chan.process()
+
+        assert self.received == [{'id': 2, 'v': 1}, {'id': 3, 'v': 1}]
+        assert (chan.coalesced, chan.dropped) == (1, 1)
+
+    def test_coalesce_unhashable(self):
+        chan = Channel(self.slot, overflow=channel.COALESCE)
+        chan(x=[])
+        chan(x=[])
+
+        assert chan.depth == 2
+
+    def test_default_does_not_block(self):
+        chan = Channel(self.slot, maxsize=1)
+        chan(x=0)
+        chan(x=1)
+
+        assert chan.dropped == 1
+        assert chan.process() == 1
+
+    def test_block_timeout(self):
+        chan = Channel(self.slot, maxsize=1, overflow=channel.BLOCK,
+                       timeout=.01)
+        chan(x=0)
+        chan(x=1)
+
+        assert chan.dropped == 1
+        chan.process()
+        assert self.received == [{'x': 0}]
+
+    def test_block(self):
+        chan = Channel(self.slot, maxsize=1, overflow=channel.BLOCK)
+        chan(x=0)
+        producer = threading.Thread(target=chan, kwargs={'x': 1})
+        producer.start()
+        time.sleep(.05)
+
+        assert producer.is_alive()
+        chan.process(limit=1)
+        producer.join(1)
+        assert not producer.is_alive()
+        chan.process()
+        assert self.received == [{'x': 0}, {'x': 1}]
+
+    def test_worker_thread(self):
+        chan = Channel(self.slot)
+        self.signal.connect(chan)
+        chan.start()
+
+        for x in range(100):
+            self.signal.emit(x=x)
+        chan.close(timeout=1)
+
+        assert self.received == [{'x': x} for x in range(100)]
+        assert self.signal.slots == []
+
+    def test_slot_exception(self):
+        def failing(**kwargs):
+            raise MyTestError()
+
+        chan = Channel(failing)
+        chan(x=1)
+        chan.process()
+
+        assert chan.errors == 1
+        assert isinstance(chan.last_exception, MyTestError)
+
+    def test_closed_drops(self):
+        chan = Channel(self.slot)
+        chan.close()
+        chan(x=1)
+
+        assert chan.dropped == 1
+        assert chan.get() is None
+
+    def test_unknown_overflow(self):
+        with pytest.raises(ValueError):
+            Channel(self.slot, overflow='foo')
+
+
+class TestFreeThreaded(object):
+    def test_default_lock(self):
+        signal = Signal()
+
+        assert isinstance(signal._slots_lk, DummyLock) != FREE_THREADED
+        assert not isinstance(Signal(threadsafe=True)._slots_lk, DummyLock)
+        assert isinstance(Signal(threadsafe=False)._slots_lk, DummyLock)
+
+    def test_emit_stats_per_thread(self):
+        signal = Signal(threadsafe=True, stats=True)
+
+        def worker():
+            for i in range(100):
+                signal.emit()
+
+        threads = [threading.Thread(target=worker, name='worker-%s' % i)
+                   for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        signal.emit()
+
+        stats = signal.emit_stats()
+        assert stats['emits'] == 401
+        assert stats['threads'] == 5
+        assert stats['per_thread'] == {
+            threading.current_thread().name: 1}
+        assert stats['finished'] == 400
+        assert len(signal._thread_stats) == 1
+
+    def test_emit_stats_running_thread(self):
+        signal = Signal(threadsafe=True, stats=True)
+        emitted = threading.Event()
+        done = threading.Event()
+
+        def worker():
+            signal.emit()
+            emitted.set()
+            done.wait()
+
+        thread = threading.Thread(target=worker, name='worker')
+        thread.start()
+        emitted.wait()
+        try:
+            assert signal.emit_stats()['per_thread'] == {'worker': 1}
+        finally:
+            done.set()
+            thread.join()
+
+    def test_emit_stats_disabled(self):
+        signal = Signal()
+        signal.emit()
+
+        assert signal.emit_stats()['emits'] == 0
+
+    def test_benchmark(self):
+        report = benchmark.run(threads=[1, 2], emits=100, slots=2)
+
+        assert [r['threads'] for r in report] == [1, 2]
+        assert report[0]['speedup'] == 1.0
+        assert report[1]['emits'] == 200
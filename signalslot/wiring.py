@@ -0,0 +1,171 @@
+"""
+Module to save the wiring of signals to a file and restore it quickly.
+
+Connecting thousands of slots one by one at startup validates each slot
+with :py:mod:`inspect`. Instead, the wiring can be dumped once:
+
+.. code-block:: python
+
+    with open('wiring.json', 'w') as fp:
+        dump_wiring([conf_loaded, request_started], fp)
+
+And loaded at startup in one pass, without validating slots again:
+
+.. code-block:: python
+
+    with open('wiring.json') as fp:
+        load_wiring([conf_loaded, request_started], fp)
+
+Only functions that can be imported by their module and qualified name are
+supported. The ``match``, ``convention`` and remaining ``max_calls`` of a
+connection are saved with it. Owners and circuit breakers cannot be saved,
+:py:func:`dump_wiring` raises
+:py:exc:`~signalslot.exceptions.SlotOptionNotSaved` rather than drop them.
+Each slot is saved with a hash of its code, and :py:func:`load_wiring`
+raises :py:exc:`~signalslot.exceptions.WiringMismatch` if the code changed
+since the wiring was dumped.
+"""
+
+import hashlib
+import importlib
+import json
+
+from . import exceptions
+from .signal import BaseSlot, KWARGS, MAPPING, ARGS, BATCH
+from .slot import Slot
+
+
+FORMAT_VERSION = 2
+
+
+def _code_hash(func):
+    """
+    Return a hash of the code of ``func``, ignoring file names and lines.
+    """
+    digest = hashlib.sha256()
+
+    def update(code):
+        digest.update(code.co_code)
+        digest.update(repr(code.co_names).encode('utf-8'))
+        digest.update(repr(code.co_varnames).encode('utf-8'))
+        for const in code.co_consts:
+            if hasattr(const, 'co_code'):
+                update(const)
+            else:
+                digest.update(repr(const).encode('utf-8'))
+
+    update(func.__code__)
+    return digest.hexdigest()
+
+
+def _import(path):
+    """
+    Return the object at ``path``, written ``module:qualified.name``.
+    """
+    module, qualname = path.split(':')
+    obj = importlib.import_module(module)
+    for name in qualname.split('.'):
+        obj = getattr(obj, name)
+    return obj
+
+
+def _path(signal, func):
+    """
+    Return the import path of ``func``, raise if it cannot be imported.
+    """
+    path = '%s:%s' % (getattr(func, '__module__', None),
+                      getattr(func, '__qualname__', None))
+    try:
+        importable = _import(path) is func
+    except (AttributeError, ImportError, ValueError):
+        importable = False
+
+    if not importable or not hasattr(func, '__code__'):
+        raise exceptions.SlotNotImportable(signal, func)
+    return path
+
+
+def _by_name(signals):
+    """
+    Return a dict of ``signals`` by name, raise if a signal has none.
+    """
+    named = {}
+    for signal in signals:
+        if not signal.name:
+            raise ValueError('Cannot save wiring of unnamed %s' % signal)
+        named[signal.name] = signal
+    return named
+
+
+def _options(signal, func, options):
+    """
+    Return the options of a connection to save, raise if one cannot be.
+    """
+    for option in ('owner', 'breaker'):
+        if options[option]:
+            raise exceptions.SlotOptionNotSaved(signal, func, option)
+
+    match = options['match']
+    if match is not None and json.loads(json.dumps(match)) != match:
+        raise exceptions.SlotOptionNotSaved(signal, func, 'match')
+
+    return {
+        'match': match,
+        'max_calls': options['max_calls'],
+        'convention': options['convention'],
+    }
+
+
+def dump_wiring(signals, fp):
+    """
+    Write the slots connected to ``signals`` to the file object ``fp``.
+    """
+    wiring = {}
+    for name, signal in _by_name(signals).items():
+        records = wiring[name] = []
+        with signal._slots_lk:
+            signal._purge()
+            slots = [(slot, signal._options(slot_id))
+                     for slot_id, slot in signal._slots.items()]
+
+        for slot, options in slots:
+            weak = isinstance(slot, Slot) and slot._weak
+            func = slot.func if isinstance(slot, BaseSlot) else slot
+            records.append(dict(_options(signal, func, options),
+                                slot=_path(signal, func),
+                                weak=weak,
+                                hash=_code_hash(func)))
+
+    json.dump({'version': FORMAT_VERSION, 'signals': wiring}, fp,
+              indent=1, sort_keys=True)
+
+
+def load_wiring(signals, fp):
+    """
+    Connect the slots read from the file object ``fp`` to ``signals``.
+
+    Every slot is imported and checked before any is connected.
+    """
+    data = json.load(fp)
+    if data.get('version') != FORMAT_VERSION:
+        raise ValueError('Unsupported wiring format %r' % data.get('version'))
+
+    named = _by_name(signals)
+    wiring = []
+    for name, records in data['signals'].items():
+        signal = named[name]
+        slots = []
+        for record in records:
+            func = _import(record['slot'])
+            if _code_hash(func) != record['hash']:
+                raise exceptions.WiringMismatch(signal, record['slot'])
+            if record['convention'] not in (KWARGS, MAPPING, ARGS, BATCH):
+                raise ValueError('Unknown calling convention %r' % (
+                    record['convention'],))
+            slots.append((Slot(func, weak=True) if record['weak'] else func,
+                          record['match'], record['max_calls'],
+                          record['convention']))
+        wiring.append((signal, slots))
+
+    for signal, slots in wiring:
+        signal._load(slots)